@@ -1,41 +1,138 @@
 """Chat endpoints with RAG implementation."""
 
+import asyncio
+import json
 import time
 import uuid
-from typing import Optional
+from typing import AsyncGenerator, Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
-from app.models.schemas import ChatRequest, ChatResponse, SourceDoc
+from app.models.schemas import ChatRequest, ChatResponse, SourceDoc, StreamChatRequest
+from app.services.embedding import embedding_service
 from app.services.indexing_service import indexing_service
 from app.services.llm import llm_service
+from app.services.semantic_cache import semantic_cache
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+# SSE batching defaults: start with single-token frames for low TTFB,
+# then grow the batch size so long generations don't pay one HTTP write
+# per token (per-token frames cost 4-5x CPU at the ASGI layer)
+DEFAULT_MIN_BATCH_SIZE = 1
+DEFAULT_BATCH_SIZE = 50
+BATCH_GROWTH_FACTOR = 3
 
-async def generate_rag_response(query: str, sources: list[SourceDoc]) -> str:
+# Pre-built serializer so chat replies skip FastAPI's jsonable_encoder +
+# stdlib json and serialize once in pydantic-core
+_CHAT_RESPONSE_ADAPTER = TypeAdapter(ChatResponse)
+
+
+# Precomputed fallback template pieces so an LLM outage doesn't rebuild
+# the static text on every request
+_FALLBACK_NO_SOURCES = (
+    "I couldn't find any specific solutions related to your query in our SolarWinds knowledge base. "
+    "Please try rephrasing your question or escalate to a senior IT staff member for assistance. "
+    "(Note: LLM service unavailable - using fallback response)"
+)
+_FALLBACK_FOOTER = """
+
+To resolve this issue:
+1. Review the solutions listed above (ranked by relevance)
+2. Follow the documented procedures in SolarWinds
+3. If the issue persists, consider escalation to senior IT staff
+
+(Note: LLM service unavailable - using fallback response. Full AI-powered guidance will be available once LLM service is configured.)"""
+
+
+def _serialize_chat_response(response: ChatResponse) -> Response:
+    """Serialize a ChatResponse directly via pydantic-core."""
+    return Response(
+        content=_CHAT_RESPONSE_ADAPTER.dump_json(response),
+        media_type="application/json",
+    )
+
+
+# How often to poll for client disconnects while generation is running
+_DISCONNECT_POLL_SECONDS = 0.2
+
+
+async def _run_cancellable(coro, http_request: Request, query_id: str):
+    """
+    Run a coroutine, cancelling it if the client disconnects.
+
+    Retrieval and LLM generation can take seconds; without this, tokens
+    keep being generated (and paid for) after the client has gone away.
+
+    Args:
+        coro: Coroutine to run
+        http_request: Starlette request used to detect disconnects
+        query_id: Query identifier for logging
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        asyncio.CancelledError: If the client disconnected
+    """
+    task = asyncio.ensure_future(coro)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=_DISCONNECT_POLL_SECONDS)
+            if task in done:
+                return task.result()
+            if await http_request.is_disconnected():
+                task.cancel()
+                logger.info("Client disconnected, cancelling chat request", extra={
+                    "query_id": query_id,
+                })
+                raise asyncio.CancelledError()
+    except asyncio.CancelledError:
+        # Propagate cancellation into the wrapped work (LLM HTTP call,
+        # vector search) so upstream requests are aborted too
+        if not task.done():
+            task.cancel()
+        raise
+
+
+async def generate_rag_response(
+    query: str,
+    sources: list[SourceDoc],
+    skeleton: Optional[dict] = None,
+) -> tuple[str, bool]:
     """
     Generate a response using the RAG pattern with real LLM integration.
-    
+
     Args:
         query: User query
         sources: Relevant source documents
-        
+        skeleton: Optional prompt skeleton prepared concurrently with retrieval
+
     Returns:
-        Generated response from LLM
+        Tuple of (response text, whether it came from the fallback
+        template) so callers can avoid caching degraded answers
     """
+    # Skip the doomed LLM call (and the cost of raising/catching per
+    # request) when the service already knows the provider is down
+    if not llm_service.is_healthy:
+        return generate_fallback_response(query, sources), True
+
     try:
         # Use the LLM service to generate a response
-        response = await llm_service.generate_response(query, sources)
-        return response
+        if skeleton is not None:
+            response = await llm_service.complete_with_sources(skeleton, sources)
+        else:
+            response = await llm_service.generate_response(query, sources)
+        return response, False
     except Exception as e:
         logger.error(f"LLM generation failed: {str(e)}")
         # Fallback to template response if LLM fails
-        return generate_fallback_response(query, sources)
+        return generate_fallback_response(query, sources), True
 
 
 def generate_fallback_response(query: str, sources: list[SourceDoc]) -> str:
@@ -50,102 +147,229 @@ def generate_fallback_response(query: str, sources: list[SourceDoc]) -> str:
         Template-based response for IT staff
     """
     if not sources:
-        return (
-            "I couldn't find any specific solutions related to your query in our SolarWinds knowledge base. "
-            "Please try rephrasing your question or escalate to a senior IT staff member for assistance. "
-            "(Note: LLM service unavailable - using fallback response)"
-        )
-    
-    # Create context from sources for IT staff
-    context_parts = []
-    for i, source in enumerate(sources, 1):
-        context_parts.append(f"{i}. {source.title} (Relevance: {source.score:.2f})")
-    
-    context = "\n".join(context_parts)
-    
-    # Generate template response for IT staff
-    response = f"""Based on the query "{query}", here are {len(sources)} relevant SolarWinds solution(s) to help you assist the user:
+        return _FALLBACK_NO_SOURCES
 
-{context}
-
-To resolve this issue:
-1. Review the solutions listed above (ranked by relevance)
-2. Follow the documented procedures in SolarWinds
-3. If the issue persists, consider escalation to senior IT staff
+    # Create context from sources for IT staff
+    context = "\n".join(
+        f"{i}. {source.title} (Relevance: {source.score:.2f})"
+        for i, source in enumerate(sources, 1)
+    )
 
-(Note: LLM service unavailable - using fallback response. Full AI-powered guidance will be available once LLM service is configured.)"""
-    
-    return response
+    # Generate template response for IT staff with a single interpolation
+    return (
+        f'Based on the query "{query}", here are {len(sources)} relevant '
+        f"SolarWinds solution(s) to help you assist the user:\n\n"
+        f"{context}{_FALLBACK_FOOTER}"
+    )
 
 
 @router.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest) -> ChatResponse:
+async def chat(request: ChatRequest, http_request: Request) -> Response:
     """
     Chat endpoint with RAG (Retrieval-Augmented Generation).
-    
+
     This endpoint:
     1. Searches for relevant solutions using semantic similarity
     2. Generates a response based on the retrieved context
     3. Returns the response with source citations
-    
+
+    Retrieval and generation are cancelled if the client disconnects, so
+    abandoned requests stop consuming LLM capacity.
+
     Args:
         request: Chat request with user query
-        
+        http_request: Underlying HTTP request, used to detect disconnects
+
     Returns:
         Generated response with source documents
     """
-    start_time = time.time()
-    query_id = str(uuid.uuid4())
+    start_ns = time.perf_counter_ns()
+    query_id = uuid.uuid4().hex
     
     try:
-        logger.info(f"Chat request received", extra={
+        logger.info("Chat request received", extra={
             "query_id": query_id,
-            "query": request.query[:100] + "..." if len(request.query) > 100 else request.query,
+            "query_preview": request.query[:100],
+            "query_len": len(request.query),
         })
         
-        # Step 1: Retrieve relevant solutions using semantic search
-        sources = await indexing_service.search_solutions(
-            query=request.query,
-            top_k=4,  # Get top 4 most relevant solutions
-            min_score=0.1  # Minimum similarity threshold
+        # Step 0: Check the semantic cache for a near-duplicate query;
+        # a hit skips retrieval and LLM generation entirely
+        query_embedding = await embedding_service.get_embedding(request.query)
+        cached_response = semantic_cache.get(query_embedding)
+        if cached_response is not None:
+            response_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            logger.info("Chat response served from semantic cache", extra={
+                "query_id": query_id,
+                "response_time_ms": response_time_ms,
+            })
+            return _serialize_chat_response(cached_response.model_copy(update={
+                "query_id": query_id,
+                "response_time_ms": response_time_ms,
+            }))
+
+        # Step 1: Retrieve relevant solutions and prepare the LLM prompt
+        # skeleton concurrently - prompt prep (provider init, system
+        # prompt) doesn't depend on the retrieved sources
+        sources, skeleton = await _run_cancellable(
+            asyncio.gather(
+                indexing_service.search_solutions(
+                    query=request.query,
+                    top_k=4,  # Get top 4 most relevant solutions
+                    min_score=0.1  # Minimum similarity threshold
+                ),
+                llm_service.prepare_prompt_skeleton(request.query),
+                return_exceptions=True,
+            ),
+            http_request,
+            query_id,
         )
-        
-        logger.info(f"Retrieved {len(sources)} relevant sources", extra={
+        if isinstance(sources, BaseException):
+            raise sources
+        if isinstance(skeleton, BaseException):
+            # Prompt prep failure shouldn't kill the request; generation
+            # will retry initialization and fall back if the LLM is down
+            logger.warning(f"Prompt preparation failed: {str(skeleton)}")
+            skeleton = None
+
+        logger.info("Retrieved %d relevant sources", len(sources), extra={
             "query_id": query_id,
             "source_count": len(sources),
         })
-        
+
         # Step 2: Generate response using RAG pattern with LLM
-        answer = await generate_rag_response(request.query, sources)
-        
+        answer, from_fallback = await _run_cancellable(
+            generate_rag_response(request.query, sources, skeleton),
+            http_request,
+            query_id,
+        )
+
         # Calculate response time
-        response_time_ms = int((time.time() - start_time) * 1000)
-        
-        response = ChatResponse(
+        response_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+        # All fields come from our own services, so skip validation
+        response = ChatResponse.model_construct(
             answer=answer,
             sources=sources,
             query_id=query_id,
             response_time_ms=response_time_ms,
         )
-        
-        logger.info(f"Chat response generated", extra={
+
+        # Cache the generated response for future near-duplicate queries.
+        # Fallback answers stay uncached so an LLM outage doesn't pin the
+        # degraded template for the full TTL after the provider recovers
+        if not from_fallback:
+            semantic_cache.set(query_embedding, response)
+
+        logger.info("Chat response generated", extra={
             "query_id": query_id,
             "response_time_ms": response_time_ms,
             "sources_used": len(sources),
         })
         
-        return response
+        return _serialize_chat_response(response)
         
     except Exception as e:
         logger.error(f"Error processing chat request: {str(e)}", extra={
             "query_id": query_id,
             "query": request.query,
         })
-        
+
         # Return error response
-        return ChatResponse(
+        return _serialize_chat_response(ChatResponse(
             answer="I'm sorry, but I encountered an error while processing your request. Please try again later or contact support.",
             sources=[],
             query_id=query_id,
-            response_time_ms=int((time.time() - start_time) * 1000),
-        )
\ No newline at end of file
+            response_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
+        ))
+
+
+@router.post("/chat/stream")
+async def chat_stream(request: StreamChatRequest) -> StreamingResponse:
+    """
+    Streaming chat endpoint with RAG (Retrieval-Augmented Generation).
+
+    Streams the response as Server-Sent Events so clients see tokens as they
+    are generated instead of waiting for the full completion:
+    1. Searches for relevant solutions using semantic similarity
+    2. Emits the sources as the first SSE event
+    3. Streams token deltas from the LLM as subsequent events
+
+    Token deltas are coalesced into frames using dynamic batching: the batch
+    size starts at min_batch_size for low time-to-first-byte and grows up to
+    max_batch_size, with flush_ms bounding how long tokens are held.
+
+    Args:
+        request: Chat request with user query and optional batching knobs
+
+    Returns:
+        StreamingResponse with text/event-stream media type
+    """
+    query_id = uuid.uuid4().hex
+
+    logger.info("Streaming chat request received", extra={
+        "query_id": query_id,
+        "query_preview": request.query[:100],
+        "query_len": len(request.query),
+    })
+
+    # Step 1: Retrieve relevant solutions using semantic search
+    sources = await indexing_service.search_solutions(
+        query=request.query,
+        top_k=4,  # Get top 4 most relevant solutions
+        min_score=0.1  # Minimum similarity threshold
+    )
+
+    async def event_source() -> AsyncGenerator[str, None]:
+        """Yield SSE frames: sources first, then batched token deltas."""
+        # Flush sources immediately so the client can render citations
+        # while the LLM is still generating
+        sources_json = json.dumps({
+            "query_id": query_id,
+            "sources": [source.model_dump() for source in sources],
+        })
+        yield f"event: sources\ndata: {sources_json}\n\n"
+
+        batch_size = request.min_batch_size
+        flush_interval = request.flush_ms / 1000
+        buf: list[str] = []
+        last_flush = time.monotonic()
+
+        try:
+            # Step 2: Stream token deltas from the LLM, coalescing tokens
+            # into frames to cut per-frame HTTP/ASGI overhead
+            async for token in llm_service.generate_response_stream(request.query, sources):
+                buf.append(token)
+
+                now = time.monotonic()
+                if len(buf) >= batch_size or now - last_flush >= flush_interval:
+                    yield f"data: {json.dumps({'deltas': buf})}\n\n"
+                    buf = []
+                    last_flush = now
+                    # Grow the batch: small frames early keep TTFB low,
+                    # larger frames later keep CPU flat on long answers
+                    batch_size = min(
+                        batch_size * BATCH_GROWTH_FACTOR,
+                        request.max_batch_size,
+                    )
+        except Exception as e:
+            logger.error(f"LLM streaming failed: {str(e)}", extra={
+                "query_id": query_id,
+            })
+            # Fall back to the template response if streaming fails
+            buf.append(generate_fallback_response(request.query, sources))
+
+        # Flush any remaining tokens before closing the stream
+        if buf:
+            yield f"data: {json.dumps({'deltas': buf})}\n\n"
+
+        yield "event: done\ndata: {}\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Simplified chat endpoints for quick startup."""
 
+import re
 import time
 import uuid
 from typing import Optional
@@ -21,20 +22,21 @@ async def chat(request: ChatRequest) -> ChatResponse:
     
     This version provides fallback responses while the full system loads.
     """
-    start_time = time.time()
-    query_id = str(uuid.uuid4())
+    start_ns = time.perf_counter_ns()
+    query_id = uuid.uuid4().hex
     
     try:
-        logger.info(f"Chat request received (simple mode)", extra={
+        logger.info("Chat request received (simple mode)", extra={
             "query_id": query_id,
-            "query": request.query[:100] + "..." if len(request.query) > 100 else request.query,
+            "query_preview": request.query[:100],
+            "query_len": len(request.query),
         })
         
         # Generate a helpful fallback response
         answer = generate_simple_response(request.query)
         
         # Calculate response time
-        response_time_ms = int((time.time() - start_time) * 1000)
+        response_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         
         response = ChatResponse(
             answer=answer,
@@ -43,7 +45,7 @@ async def chat(request: ChatRequest) -> ChatResponse:
             response_time_ms=response_time_ms,
         )
         
-        logger.info(f"Chat response generated (simple mode)", extra={
+        logger.info("Chat response generated (simple mode)", extra={
             "query_id": query_id,
             "response_time_ms": response_time_ms,
         })
@@ -61,17 +63,11 @@ async def chat(request: ChatRequest) -> ChatResponse:
             answer="I'm sorry, but I'm currently starting up. Please try again in a moment, or check that all services are properly configured.",
             sources=[],
             query_id=query_id,
-            response_time_ms=int((time.time() - start_time) * 1000),
+            response_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
         )
 
 
-def generate_simple_response(query: str) -> str:
-    """Generate a simple response based on keywords in the query."""
-    query_lower = query.lower()
-    
-    # Simple keyword-based responses
-    if any(word in query_lower for word in ["password", "reset", "login", "account"]):
-        return """For password reset issues:
+_PASSWORD_RESPONSE = """For password reset issues:
         
 1. **Verify user identity** through secondary authentication
 2. **Access Active Directory** Users and Computers console
@@ -83,9 +79,8 @@ def generate_simple_response(query: str) -> str:
 8. **Document the reset** in your ticketing system
 
 ⚠️ Note: This is a simplified response. For full AI-powered assistance with source citations, please ensure all services are running."""
-    
-    elif any(word in query_lower for word in ["printer", "print", "spooler"]):
-        return """For printer connectivity issues:
+
+_PRINTER_RESPONSE = """For printer connectivity issues:
         
 1. **Check physical connections** (USB/Ethernet cables)
 2. **Verify printer power** and display messages
@@ -97,9 +92,8 @@ def generate_simple_response(query: str) -> str:
 8. **Consider IP conflicts** for network printers
 
 ⚠️ Note: This is a simplified response. For full AI-powered assistance with source citations, please ensure all services are running."""
-    
-    elif any(word in query_lower for word in ["vpn", "connection", "network", "internet"]):
-        return """For VPN/Network connection problems:
+
+_VPN_RESPONSE = """For VPN/Network connection problems:
         
 1. **Verify user credentials** and account status
 2. **Check VPN client software** version and updates  
@@ -111,9 +105,8 @@ def generate_simple_response(query: str) -> str:
 8. **Test alternative protocols** if available
 
 ⚠️ Note: This is a simplified response. For full AI-powered assistance with source citations, please ensure all services are running."""
-    
-    elif any(word in query_lower for word in ["email", "outlook", "exchange", "mail"]):
-        return """For email client configuration:
+
+_EMAIL_RESPONSE = """For email client configuration:
         
 **Outlook Setup:**
 1. Open Outlook → File → Add Account
@@ -130,9 +123,8 @@ def generate_simple_response(query: str) -> str:
 - Enable SSL/TLS encryption
 
 ⚠️ Note: This is a simplified response. For full AI-powered assistance with source citations, please ensure all services are running."""
-    
-    else:
-        return f"""I understand you're asking about: "{query}"
+
+_GENERAL_RESPONSE_TEMPLATE = """I understand you're asking about: "{query}"
 
 I'm currently running in simplified mode while the full AI system initializes. Here are some general IT troubleshooting steps:
 
@@ -152,4 +144,35 @@ I'm currently running in simplified mode while the full AI system initializes. H
 - Detailed step-by-step guidance
 - Real-time system integration
 
-Please ensure all services are running properly, or try the Docker deployment for a complete setup."""
\ No newline at end of file
+Please ensure all services are running properly, or try the Docker deployment for a complete setup."""
+
+# One precompiled alternation replaces four per-request substring scans;
+# group order preserves the original if/elif category precedence
+_KEYWORD_PATTERN = re.compile(
+    r"(?P<password>password|reset|login|account)"
+    r"|(?P<printer>printer|print|spooler)"
+    r"|(?P<vpn>vpn|connection|network|internet)"
+    r"|(?P<email>email|outlook|exchange|mail)"
+)
+_CATEGORY_PRIORITY = {"password": 0, "printer": 1, "vpn": 2, "email": 3}
+_CATEGORY_RESPONSES = [_PASSWORD_RESPONSE, _PRINTER_RESPONSE, _VPN_RESPONSE, _EMAIL_RESPONSE]
+
+
+def generate_simple_response(query: str) -> str:
+    """Generate a simple response based on keywords in the query."""
+    query_lower = query.lower()
+
+    # Single pass over the query: track the highest-priority category seen
+    # and stop early once the top-priority category matches
+    best_priority = None
+    for match in _KEYWORD_PATTERN.finditer(query_lower):
+        priority = _CATEGORY_PRIORITY[match.lastgroup]
+        if best_priority is None or priority < best_priority:
+            best_priority = priority
+            if priority == 0:
+                break
+
+    if best_priority is not None:
+        return _CATEGORY_RESPONSES[best_priority]
+
+    return _GENERAL_RESPONSE_TEMPLATE.format(query=query)
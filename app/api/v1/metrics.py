@@ -1,11 +1,13 @@
 """Metrics endpoints for monitoring and observability."""
 
+import asyncio
 import psutil
 import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
 from app.core.config import settings
@@ -49,6 +51,80 @@ class ApplicationMetrics(BaseModel):
 # Store application start time for uptime calculation
 _start_time = time.time()
 
+# Cached psutil readings refreshed off the event loop. psutil.cpu_percent
+# with an interval sleeps for that long on the calling thread, which would
+# stall every other request when called from an async endpoint.
+_PSUTIL_CACHE_TTL = 1.0
+# Disk usage is a statvfs syscall and barely changes; refresh it far
+# less often than the cpu/memory readings
+_DISK_CACHE_TTL = 10.0
+_psutil_cache: Dict[str, Any] = {"ts": 0.0, "disk_ts": 0.0, "cpu": 0.0, "mem": None, "disk": None}
+_refresh_task: Optional[asyncio.Task] = None
+
+
+def _collect_psutil_sync(include_disk: bool) -> Tuple[float, Any, Any]:
+    """Collect psutil readings (sync operation, safe on a worker thread)."""
+    cpu_percent = psutil.cpu_percent(interval=0.1)
+    memory = psutil.virtual_memory()
+    disk = psutil.disk_usage('/') if include_disk else None
+    return cpu_percent, memory, disk
+
+
+async def _refresh_psutil() -> None:
+    """Background task that refreshes the psutil cache every TTL period."""
+    while True:
+        try:
+            now = time.time()
+            include_disk = now - _psutil_cache["disk_ts"] >= _DISK_CACHE_TTL
+            cpu_percent, memory, disk = await asyncio.to_thread(
+                _collect_psutil_sync, include_disk
+            )
+            _psutil_cache.update({
+                "ts": time.time(),
+                "cpu": cpu_percent,
+                "mem": memory,
+            })
+            if disk is not None:
+                _psutil_cache.update({"disk": disk, "disk_ts": time.time()})
+        except Exception as e:
+            logger.warning(f"psutil refresh failed: {str(e)}")
+        await asyncio.sleep(_PSUTIL_CACHE_TTL)
+
+
+def start_psutil_refresh() -> None:
+    """Start the background psutil refresh task (called from app lifespan)."""
+    global _refresh_task
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.get_event_loop().create_task(_refresh_psutil())
+        logger.info("Started psutil metrics refresh task")
+
+
+def stop_psutil_refresh() -> None:
+    """Stop the background psutil refresh task."""
+    global _refresh_task
+    if _refresh_task and not _refresh_task.done():
+        _refresh_task.cancel()
+    _refresh_task = None
+
+
+def _get_psutil_snapshot() -> Tuple[float, Any, Any]:
+    """
+    Get cached psutil readings, refreshing inline if the cache is cold.
+
+    The inline fallback uses interval=None (non-blocking delta since the
+    previous call) so it never sleeps on the event loop thread.
+    """
+    now = time.time()
+    if _psutil_cache["mem"] is None or now - _psutil_cache["ts"] > _PSUTIL_CACHE_TTL:
+        _psutil_cache.update({
+            "ts": now,
+            "cpu": psutil.cpu_percent(interval=None),
+            "mem": psutil.virtual_memory(),
+        })
+    if _psutil_cache["disk"] is None or now - _psutil_cache["disk_ts"] > _DISK_CACHE_TTL:
+        _psutil_cache.update({"disk": psutil.disk_usage('/'), "disk_ts": now})
+    return _psutil_cache["cpu"], _psutil_cache["mem"], _psutil_cache["disk"]
+
 
 @router.get(
     "/metrics",
@@ -67,11 +143,9 @@ async def get_metrics() -> ApplicationMetrics:
     current_time = time.time()
     uptime = current_time - _start_time
     
-    # Get system metrics
-    cpu_percent = psutil.cpu_percent(interval=0.1)
-    memory = psutil.virtual_memory()
-    disk = psutil.disk_usage('/')
-    
+    # Get system metrics from the cache
+    cpu_percent, memory, disk = _get_psutil_snapshot()
+
     system_metrics = SystemMetrics(
         cpu_percent=cpu_percent,
         memory_percent=memory.percent,
@@ -103,12 +177,9 @@ async def get_metrics() -> ApplicationMetrics:
     status_code=status.HTTP_200_OK,
     summary="Prometheus Metrics",
     description="Returns metrics in Prometheus format for scraping",
-    response_class=type("PlainTextResponse", (), {
-        "media_type": "text/plain",
-        "__init__": lambda self, content: setattr(self, "body", content.encode()),
-    }),
+    response_class=PlainTextResponse,
 )
-async def get_prometheus_metrics():
+async def get_prometheus_metrics() -> str:
     """
     Get metrics in Prometheus format.
     
@@ -118,10 +189,9 @@ async def get_prometheus_metrics():
     current_time = time.time()
     uptime = current_time - _start_time
     
-    # Get system metrics
-    cpu_percent = psutil.cpu_percent(interval=0.1)
-    memory = psutil.virtual_memory()
-    
+    # Get system metrics from the cache
+    cpu_percent, memory, _ = _get_psutil_snapshot()
+
     # Generate Prometheus format metrics
     prometheus_metrics = f"""# HELP solarwinds_chatbot_uptime_seconds Time since application start
 # TYPE solarwinds_chatbot_uptime_seconds gauge
@@ -161,9 +231,8 @@ async def get_health_summary() -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Simple health status summary
     """
-    cpu_percent = psutil.cpu_percent(interval=0.1)
-    memory = psutil.virtual_memory()
-    
+    cpu_percent, memory, _ = _get_psutil_snapshot()
+
     # Determine health status based on resource usage
     health_status = "healthy"
     if cpu_percent > 80 or memory.percent > 90:
@@ -1,54 +1,98 @@
 """Solutions endpoints with SolarWinds integration."""
 
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import asyncio
+import hashlib
+import logging
+import uuid
 
-from fastapi import APIRouter, HTTPException, status
+import orjson
+from typing import Annotated, List, Dict, Any, Optional
 
-from app.models.schemas import SolutionRecord, SyncStatus
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+
+from pydantic import TypeAdapter
+
+from app.core.clock import get_current_iso
+from app.core.config import settings
+from app.models.schemas import BatchSearchRequest, SolutionRecord, SourceDoc, SyncStatus
 from app.services.sync_service import sync_service
 from app.services.solarwinds import solarwinds_service
 from app.services.indexing_service import indexing_service
-from app.core.logging import get_logger
+from app.services.response_cache import ResponseCache, response_cache
+from app.services.semantic_cache import semantic_cache
+from app.core.logging import get_bound_logger
 
-logger = get_logger(__name__)
+logger = get_bound_logger(__name__, component="solutions")
 
 router = APIRouter()
 
+# Cache TTLs for read-heavy GET endpoints; the underlying data only
+# changes on sync, so repeat calls can skip the stats/status pipeline
+_SYNC_STATUS_CACHE_TTL = 15.0
+_INDEX_STATS_CACHE_TTL = 60.0
+
+# Pre-built serializers so result lists are dumped in one pydantic-core
+# call instead of one model_dump() trampoline per element
+_SOURCE_DOC_LIST_ADAPTER = TypeAdapter(List[SourceDoc])
+_SOURCE_DOC_BATCH_ADAPTER = TypeAdapter(List[List[SourceDoc]])
+_SOLUTION_RECORD_ADAPTER = TypeAdapter(SolutionRecord)
+
 
 @router.get("/solutions", response_model=List[SolutionRecord])
 async def list_solutions(
-    limit: int = 50,
+    request: Request,
+    response: Response,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+    offset: Annotated[int, Query(ge=0)] = 0,
     category: Optional[str] = None
 ) -> List[SolutionRecord]:
     """
-    List solutions endpoint.
-    
+    List solutions with pagination and HTTP caching.
+
+    Responses carry an ETag and Cache-Control headers; clients that
+    revalidate with If-None-Match get a 304 without re-serializing the
+    page, and the data only changes on sync anyway.
+
     Args:
+        request: Underlying HTTP request, used for If-None-Match
+        response: Response to attach caching headers to
         limit: Maximum number of solutions to return
+        offset: Number of solutions to skip
         category: Optional category filter
-    
+
     Returns:
-        List of solution records
+        Page of solution records
     """
     try:
-        # Get index stats to see available solutions
-        stats = await indexing_service.get_index_stats()
-        total_count = stats.get("vector_store", {}).get("total_documents", 0)
-        
-        if total_count == 0:
-            logger.info("No solutions available in index")
-            return []
-        
-        # For now, we'll return a placeholder response since we need a more complex
-        # query to list all solutions. The vector store is optimized for semantic search.
-        logger.info(f"Solutions list requested - {total_count} available in index")
-        
-        # TODO: Implement proper listing functionality in vector store
-        return []
-        
+        solutions = await indexing_service.list_solutions(
+            limit=limit,
+            offset=offset,
+            category_filter=category,
+        )
+
+        # Fingerprint the page by id + updated_at so any sync that touches
+        # these records changes the ETag
+        fingerprint = ";".join(f"{sol.id}:{sol.updated_at.isoformat()}" for sol in solutions)
+        etag = hashlib.md5(f"{fingerprint}:{offset}:{limit}:{category}".encode()).hexdigest()
+
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+        max_age = settings.sync_interval_minutes * 60
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = f"max-age={max_age}, stale-while-revalidate=30"
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Solutions list returned %d records", len(solutions), extra={
+                "limit": limit,
+                "offset": offset,
+                "category": category,
+            })
+
+        return solutions
+
     except Exception as e:
-        logger.error(f"Error listing solutions: {str(e)}")
+        logger.error("Error listing solutions: %s", str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list solutions: {str(e)}"
@@ -64,58 +108,170 @@ async def get_sync_status() -> Dict[str, Any]:
         Current sync status and statistics
     """
     try:
-        sync_status = await sync_service.get_sync_status()
-        solarwinds_stats = await solarwinds_service.get_sync_stats()
-        
+        cached = await response_cache.get("sync-status")
+        if cached is not None:
+            return cached
+
+        # The two status sources are independent I/O, so overlap them
+        sync_status, solarwinds_stats = await asyncio.gather(
+            sync_service.get_sync_status(),
+            solarwinds_service.get_sync_stats(),
+            return_exceptions=True,
+        )
+        if isinstance(sync_status, BaseException):
+            sync_status = {"error": str(sync_status)}
+        if isinstance(solarwinds_stats, BaseException):
+            solarwinds_stats = {"error": str(solarwinds_stats)}
+
         # Combine sync service status with SolarWinds stats
         combined_status = {
             **sync_status,
             "solarwinds_api": solarwinds_stats,
         }
-        
-        logger.info("Sync status requested", extra={
-            "service_running": sync_status.get("service_running", False),
-            "sync_in_progress": sync_status.get("sync_in_progress", False),
-        })
-        
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Sync status requested", extra={
+                "service_running": sync_status.get("service_running", False),
+                "sync_in_progress": sync_status.get("sync_in_progress", False),
+            })
+
+        await response_cache.set("sync-status", combined_status, _SYNC_STATUS_CACHE_TTL)
         return combined_status
         
     except Exception as e:
-        logger.error(f"Error getting sync status: {str(e)}")
+        logger.error("Error getting sync status: %s", str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get sync status: {str(e)}"
         )
 
 
-@router.post("/solutions/sync")
+# Background sync jobs keyed by job id; the active pointer lets repeat
+# triggers collapse onto the in-flight job instead of queueing another.
+# Jobs expire by TTL rather than a history cap
+_SYNC_JOB_TTL_SECONDS = 3600.0
+_ACTIVE_SYNC_JOB_KEY = "active"
+
+
+class _SyncJobStore(ResponseCache):
+    """
+    Sync job registry shared across workers.
+
+    The app ships with workers=settings.max_workers, so a job queued on
+    one worker must be pollable from any of them; Redis (via the
+    ResponseCache backend) provides that, with the inherited in-process
+    fallback covering single-worker runs without Redis. A dedicated
+    prefix keeps jobs out of response_cache.clear()'s blast radius.
+    """
+
+    KEY_PREFIX = "sw-sync-job"
+
+
+_sync_jobs = _SyncJobStore()
+
+# Strong references to in-flight sync tasks: the event loop only keeps
+# weak refs, so without these a queued job could be garbage-collected
+# mid-run and stay stuck "running" for its whole TTL. Also gives
+# shutdown a handle to cancel in-flight syncs
+_sync_tasks: set = set()
+
+
+async def _run_sync_job(job_id: str, force: bool) -> None:
+    """Run a queued sync to completion and record its outcome."""
+    job = await _sync_jobs.get(job_id) or {"job_id": job_id, "force": force}
+    job["status"] = "running"
+    await _sync_jobs.set(job_id, job, _SYNC_JOB_TTL_SECONDS)
+    try:
+        result = await sync_service.trigger_sync(force=force)
+        job["status"] = "completed"
+        job["result"] = result
+
+        logger.info("Background sync %s completed with status: %s", job_id, result.get("status"))
+
+        # Invalidate cached GET responses so a completed sync is visible
+        # immediately instead of after the TTLs expire
+        await response_cache.clear()
+        # Cached chat answers cite pre-sync sources; drop them too so a
+        # paraphrase hit can't serve guidance built on stale solutions
+        semantic_cache.clear()
+
+    except Exception as e:
+        logger.error("Background sync %s failed: %s", job_id, str(e))
+        job["status"] = "failed"
+        job["error"] = str(e)
+    finally:
+        job["finished_at"] = get_current_iso()
+        await _sync_jobs.set(job_id, job, _SYNC_JOB_TTL_SECONDS)
+        if await _sync_jobs.get(_ACTIVE_SYNC_JOB_KEY) == job_id:
+            await _sync_jobs.set(_ACTIVE_SYNC_JOB_KEY, None, 1)
+
+
+@router.post("/solutions/sync", status_code=status.HTTP_202_ACCEPTED)
 async def trigger_sync(force: bool = False) -> Dict[str, Any]:
     """
     Trigger manual sync endpoint.
-    
+
+    The sync runs as a background task and the request returns 202
+    immediately with a job id; repeat non-force triggers while a sync is
+    in flight return the existing job instead of queueing another.
+
     Args:
         force: Force sync even if one is already in progress
-        
+
     Returns:
-        Sync operation result
+        Queued job id and status, pollable at /solutions/sync/{job_id}
     """
     try:
-        logger.info(f"Manual sync triggered with force={force}")
-        
-        result = await sync_service.trigger_sync(force=force)
-        
-        logger.info(f"Manual sync completed with status: {result.get('status')}")
-        
-        return result
-        
+        logger.info("Manual sync triggered with force=%s", force)
+
+        # Dedup: collapse repeat triggers onto the in-flight job
+        active_id = await _sync_jobs.get(_ACTIVE_SYNC_JOB_KEY)
+        active = await _sync_jobs.get(active_id) if active_id else None
+        if not force and active and active["status"] in ("queued", "running"):
+            return {"job_id": active_id, "status": active["status"]}
+
+        job_id = uuid.uuid4().hex
+        await _sync_jobs.set(job_id, {
+            "job_id": job_id,
+            "status": "queued",
+            "force": force,
+            "queued_at": get_current_iso(),
+        }, _SYNC_JOB_TTL_SECONDS)
+        await _sync_jobs.set(_ACTIVE_SYNC_JOB_KEY, job_id, _SYNC_JOB_TTL_SECONDS)
+        task = asyncio.create_task(_run_sync_job(job_id, force))
+        _sync_tasks.add(task)
+        task.add_done_callback(_sync_tasks.discard)
+
+        return {"job_id": job_id, "status": "queued"}
+
     except Exception as e:
-        logger.error(f"Error triggering sync: {str(e)}")
+        logger.error("Error triggering sync: %s", str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to trigger sync: {str(e)}"
         )
 
 
+@router.get("/solutions/sync/{job_id}")
+async def get_sync_job(job_id: str) -> Dict[str, Any]:
+    """
+    Get the status of a queued or finished sync job.
+
+    Args:
+        job_id: Job id returned by POST /solutions/sync
+
+    Returns:
+        Job status, and the sync result once completed
+    """
+    job = await _sync_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Sync job not found: {job_id}"
+        )
+    return job
+
+
 @router.get("/solutions/test-connection")
 async def test_solarwinds_connection() -> Dict[str, Any]:
     """
@@ -131,7 +287,7 @@ async def test_solarwinds_connection() -> Dict[str, Any]:
         
         result = {
             "connected": is_connected,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": get_current_iso(),
             "api_configured": bool(solarwinds_service.client.api_key and solarwinds_service.client.base_url),
         }
         
@@ -143,20 +299,20 @@ async def test_solarwinds_connection() -> Dict[str, Any]:
         return result
         
     except Exception as e:
-        logger.error(f"Error testing SolarWinds connection: {str(e)}")
+        logger.error("Error testing SolarWinds connection: %s", str(e))
         return {
             "connected": False,
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": get_current_iso(),
         }
 
 
 @router.get("/solutions/search")
 async def search_solutions(
     q: str,
-    limit: int = 10,
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
     category: Optional[str] = None,
-    min_score: float = 0.0
+    min_score: Annotated[float, Query(ge=0.0, le=1.0)] = 0.0
 ) -> List[Dict[str, Any]]:
     """
     Search solutions using semantic similarity.
@@ -177,7 +333,7 @@ async def search_solutions(
                 detail="Query parameter 'q' is required"
             )
         
-        logger.info(f"Solution search requested: '{q[:100]}'")
+        logger.info("Solution search requested: '%s'", q[:100])
         
         results = await indexing_service.search_solutions(
             query=q,
@@ -186,18 +342,99 @@ async def search_solutions(
             min_score=min_score
         )
         
-        return [result.model_dump() for result in results]
+        return _SOURCE_DOC_LIST_ADAPTER.dump_python(results, mode="json")
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error searching solutions: {str(e)}")
+        logger.error("Error searching solutions: %s", str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Solution search failed: {str(e)}"
         )
 
 
+@router.post("/solutions/search-batch")
+async def search_solutions_batch(request: BatchSearchRequest) -> List[List[Dict[str, Any]]]:
+    """
+    Search solutions for multiple queries in a single request.
+
+    All queries share one batched embedding call and one vector store
+    query, so a UI firing many suggested queries pays roughly one
+    query's latency instead of one round trip per query.
+
+    Args:
+        request: Batch search request with queries and filters
+
+    Returns:
+        One result list per query, aligned to the input order
+    """
+    try:
+        logger.info("Batch solution search requested for %d queries", len(request.queries))
+
+        batch_results = await indexing_service.search_solutions_batch(
+            queries=request.queries,
+            top_k=request.limit,
+            category_filter=request.category,
+            min_score=request.min_score,
+        )
+
+        return _SOURCE_DOC_BATCH_ADAPTER.dump_python(batch_results, mode="json")
+
+    except Exception as e:
+        logger.error("Error in batch solution search: %s", str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch solution search failed: {str(e)}"
+        )
+
+
+async def _build_index_stats() -> Dict[str, Any]:
+    """Assemble the /solutions/stats payload (stats and health overlap)."""
+    stats, health = await asyncio.gather(
+        indexing_service.get_index_stats(),
+        indexing_service.health_check(),
+        return_exceptions=True,
+    )
+    if isinstance(stats, BaseException):
+        stats = {"error": str(stats)}
+    if isinstance(health, BaseException):
+        health = {"healthy": False, "error": str(health)}
+
+    return {
+        **stats,
+        "health": health,
+        "timestamp": get_current_iso(),
+    }
+
+
+async def warm_response_cache() -> None:
+    """
+    Pre-populate cached GET payloads at startup.
+
+    The first requests after boot would otherwise pay the cold path
+    (ChromaDB stats scan, per-solution reads); warming from lifespan
+    turns them into cache hits.
+    """
+    try:
+        await response_cache.set(
+            "index-stats", await _build_index_stats(), _INDEX_STATS_CACHE_TTL
+        )
+
+        # Warm the first page of solutions - the records dashboards and
+        # list views request first
+        solutions = await indexing_service.list_solutions(limit=10)
+        ttl = settings.sync_interval_minutes * 60
+        for solution in solutions:
+            body = orjson.dumps(_SOLUTION_RECORD_ADAPTER.dump_python(solution, mode="json"))
+            await response_cache.set(f"sol:bytes:{solution.id}", body.decode(), ttl)
+
+        logger.info("Warmed response cache with stats and %d solutions", len(solutions))
+
+    except Exception as e:
+        logger.warning("Response cache warm-up failed: %s", str(e))
+
+
 @router.get("/solutions/stats")
 async def get_index_stats() -> Dict[str, Any]:
     """
@@ -207,17 +444,16 @@ async def get_index_stats() -> Dict[str, Any]:
         Index statistics and health information
     """
     try:
-        stats = await indexing_service.get_index_stats()
-        health = await indexing_service.health_check()
-        
-        return {
-            **stats,
-            "health": health,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        cached = await response_cache.get("index-stats")
+        if cached is not None:
+            return cached
+
+        result = await _build_index_stats()
+        await response_cache.set("index-stats", result, _INDEX_STATS_CACHE_TTL)
+        return result
         
     except Exception as e:
-        logger.error(f"Error getting index stats: {str(e)}")
+        logger.error("Error getting index stats: %s", str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get index stats: {str(e)}"
@@ -225,31 +461,43 @@ async def get_index_stats() -> Dict[str, Any]:
 
 
 @router.get("/solutions/{solution_id}")
-async def get_solution(solution_id: str) -> Dict[str, Any]:
+async def get_solution(solution_id: str) -> Response:
     """
     Get a specific solution by ID.
-    
+
+    The solution's JSON body is cached as pre-serialized bytes, so a hit
+    is returned verbatim without re-running pydantic dumping or the
+    response encoder.
+
     Args:
         solution_id: Solution ID
-        
+
     Returns:
         Solution details
     """
     try:
+        cache_key = f"sol:bytes:{solution_id}"
+        cached = await response_cache.get(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
         solution = await indexing_service.get_solution_by_id(solution_id)
-        
+
         if not solution:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Solution not found: {solution_id}"
             )
-        
-        return solution.model_dump()
+
+        body = orjson.dumps(_SOLUTION_RECORD_ADAPTER.dump_python(solution, mode="json"))
+        # Solutions only change on sync, so cache for one sync interval
+        await response_cache.set(cache_key, body.decode(), settings.sync_interval_minutes * 60)
+        return Response(content=body, media_type="application/json")
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting solution: {str(e)}")
+        logger.error("Error getting solution: %s", str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get solution: {str(e)}"
@@ -0,0 +1,58 @@
+"""Coarse shared timestamp refreshed by a background task."""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# How often the background task refreshes the cached timestamp. Handlers
+# that stamp responses at this granularity produce bit-identical bodies
+# for a full second, which is what makes ETag/proxy caching effective.
+_TICK_SECONDS = 1.0
+
+_current_iso = datetime.now(timezone.utc).isoformat()
+_current_monotonic = time.monotonic()
+_tick_task: Optional[asyncio.Task] = None
+
+
+def get_current_iso() -> str:
+    """
+    Get the cached ISO 8601 timestamp (UTC, ~1s granularity).
+
+    Falls back to an inline refresh when the background task isn't
+    running (e.g. the quick-start apps, which skip lifespan events).
+    """
+    global _current_iso, _current_monotonic
+    if time.monotonic() - _current_monotonic > 2 * _TICK_SECONDS:
+        _current_iso = datetime.now(timezone.utc).isoformat()
+        _current_monotonic = time.monotonic()
+    return _current_iso
+
+
+async def _tick() -> None:
+    """Background task that refreshes the cached timestamp every second."""
+    global _current_iso, _current_monotonic
+    while True:
+        _current_iso = datetime.now(timezone.utc).isoformat()
+        _current_monotonic = time.monotonic()
+        await asyncio.sleep(_TICK_SECONDS)
+
+
+def start_clock() -> None:
+    """Start the background clock task (called from app lifespan)."""
+    global _tick_task
+    if _tick_task is None or _tick_task.done():
+        _tick_task = asyncio.get_event_loop().create_task(_tick())
+        logger.info("Started shared clock task")
+
+
+def stop_clock() -> None:
+    """Stop the background clock task."""
+    global _tick_task
+    if _tick_task and not _tick_task.done():
+        _tick_task.cancel()
+    _tick_task = None
@@ -1,5 +1,6 @@
 """Application configuration using Pydantic Settings."""
 
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import Field
@@ -14,12 +15,16 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="forbid",
+        # Settings never change after startup; freezing lets pydantic skip
+        # copy-on-set machinery and catches accidental mutation
+        frozen=True,
     )
 
     # Application Settings
     app_name: str = Field(default="SolarWinds IT Solutions Chatbot", description="Application name")
     debug: bool = Field(default=False, description="Debug mode")
     log_level: str = Field(default="INFO", description="Logging level")
+    log_format: str = Field(default="text", description="Log output format (text or json)")
 
     # API Settings  
     api_v1_prefix: str = Field(default="/api/v1", description="API v1 prefix")
@@ -28,6 +33,14 @@ class Settings(BaseSettings):
         "http://localhost:8501",      # Streamlit local development
         "https://*.streamlit.app"     # Streamlit Cloud deployment
     ], description="CORS allowed origins")
+    # Regex equivalent of cors_origins: localhost dev servers plus any
+    # *.streamlit.app deployment. CORSMiddleware compares literal origins
+    # with Python-level equality and can't expand the wildcard above, so
+    # the regex (matched in C by re) is what the apps actually use.
+    cors_origin_regex: str = Field(
+        default=r"^(https?://localhost:(3000|8501)|https://[^/]+\.streamlit\.app)$",
+        description="CORS allowed origin regex",
+    )
 
     # SolarWinds API Settings
     solarwinds_api_key: Optional[str] = Field(default=None, description="SolarWinds API key")
@@ -54,11 +67,20 @@ class Settings(BaseSettings):
     ollama_base_url: str = Field(default="http://localhost:11434", description="OLLAMA base URL")
     ollama_model: str = Field(default="llama2", description="OLLAMA model name")
 
+    # LLM Response Cache
+    llm_cache_ttl_seconds: int = Field(default=3600, description="TTL for cached LLM completions (0 disables)")
+    semantic_cache_threshold: float = Field(default=0.85, description="Minimum cosine similarity for a semantic cache hit")
+
     # Embedding Settings
     embedding_provider: str = Field(default="openai", description="Embedding provider (openai or local)")
     openai_api_key: Optional[str] = Field(default=None, description="OpenAI API key for embeddings")
     embedding_model: str = Field(default="text-embedding-3-small", description="Embedding model name")
     embedding_dimension: int = Field(default=1536, description="Embedding dimension")
+    embedding_device: str = Field(default="auto", description="Device for local embeddings (auto, cuda, or cpu)")
+    openai_concurrency: int = Field(default=8, description="Max concurrent OpenAI embedding requests")
+    embedding_cache_path: Optional[str] = Field(default="data/embedding_cache", description="LMDB path for the persistent embedding cache (disabled when unset)")
+    embed_workers: int = Field(default=2, description="Worker processes for CPU-bound local encoding")
+    speculative_embedding: bool = Field(default=True, description="Start embeddings before validation finishes (wastes a call on invalid content)")
 
     # Redis Settings (optional - falls back to in-memory storage)
     redis_url: str = Field(default="redis://localhost:6379", description="Redis connection URL")
@@ -71,17 +93,27 @@ class Settings(BaseSettings):
 
     # Performance Settings
     max_search_results: int = Field(default=4, description="Maximum number of search results")
+    source_token_budget: int = Field(default=512, description="Max tokens of source content per prompt source (0 disables trimming)")
     response_timeout_seconds: int = Field(default=30, description="Response timeout in seconds")
+    embedding_quantization: str = Field(default="int8", description="In-memory scan precision (fp32 or int8)")
+    cache_quantization: str = Field(default="int8", description="Embedding cache precision (fp32 or int8)")
     
     # Security Settings
     allowed_hosts: list[str] = Field(default=["*"], description="Allowed hosts")
 
 
-# Global settings instance
 # Create settings with explicit environment variables for development
 import os
 os.environ.setdefault('DEBUG', 'true')
 os.environ.setdefault('LLM_PROVIDER', 'ollama')
 os.environ.setdefault('EMBEDDING_PROVIDER', 'local')
 
-settings = Settings()
\ No newline at end of file
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the settings singleton, parsing the environment only once."""
+    return Settings()
+
+
+# Global settings instance
+settings = get_settings()
\ No newline at end of file
@@ -0,0 +1,259 @@
+"""Application factory shared by the full, simple and quick entrypoints."""
+
+import asyncio
+import importlib
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Dict, List, Literal, Tuple
+
+from fastapi import FastAPI, Request, status
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.core.config import settings
+from app.core.exceptions import SolarWindsChatbotException
+from app.core.logging import setup_logging, get_logger
+
+# Setup logging once, for whichever entrypoint imports the factory
+setup_logging()
+logger = get_logger(__name__)
+
+AppMode = Literal["full", "simple", "quick"]
+
+# Router module paths per mode. Modules are resolved at include time, so
+# the quick app never imports the heavy chromadb/torch service stack.
+_MODE_ROUTERS: Dict[str, List[Tuple[str, str]]] = {
+    "full": [
+        ("app.api.v1.health", "health"),
+        ("app.api.v1.chat", "chat"),
+        ("app.api.v1.solutions", "solutions"),
+        ("app.api.v1.metrics", "metrics"),
+    ],
+    "simple": [
+        ("app.api.v1.health", "health"),
+        ("app.api.v1.chat", "chat"),
+        ("app.api.v1.solutions", "solutions"),
+        ("app.api.v1.metrics", "metrics"),
+    ],
+    "quick": [
+        ("app.api.v1.health_simple", "health"),
+        ("app.api.v1.chat_simple", "chat"),
+        ("app.api.v1.metrics", "metrics"),
+    ],
+}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Full-mode application lifespan events."""
+    # Services are imported lazily so that constructing the app object
+    # (and the simple/quick modes, which skip lifespan entirely) stays
+    # cheap; the cost is paid once here, at actual startup.
+    indexing_service = importlib.import_module("app.services.indexing_service").indexing_service
+    llm_service = importlib.import_module("app.services.llm").llm_service
+    sync_service = importlib.import_module("app.services.sync_service").sync_service
+    solutions_api = importlib.import_module("app.api.v1.solutions")
+    metrics_api = importlib.import_module("app.api.v1.metrics")
+    clock = importlib.import_module("app.core.clock")
+
+    # Startup
+    logger.info("Starting SolarWinds IT Solutions Chatbot")
+    logger.info("Debug mode: %s", settings.debug)
+    logger.info("Log level: %s", settings.log_level)
+    logger.info("LLM Provider: %s", settings.llm_provider)
+    logger.info("Embedding Provider: %s", settings.embedding_provider)
+
+    # Initialize services concurrently - they are independent, so cold
+    # start is the slowest init instead of the sum of all of them.
+    # Startup continues even if individual services fail.
+    logger.info("Starting indexing, LLM and background sync services")
+    results = await asyncio.gather(
+        indexing_service.initialize(),
+        llm_service.initialize(),
+        sync_service.start(),
+        return_exceptions=True,
+    )
+    for name, result in zip(("indexing", "LLM", "sync"), results):
+        if isinstance(result, BaseException):
+            logger.error("Failed to start %s service: %s", name, str(result))
+
+    # Warm the response cache so the first requests hit Redis instead of
+    # the cold stats/solution paths
+    await solutions_api.warm_response_cache()
+
+    # Start the metrics refresh task so scrapes never block the event loop
+    metrics_api.start_psutil_refresh()
+
+    # Start the shared clock used for response timestamps
+    clock.start_clock()
+
+    yield
+
+    metrics_api.stop_psutil_refresh()
+    clock.stop_clock()
+
+    # Shutdown
+    logger.info("Shutting down SolarWinds IT Solutions Chatbot")
+
+    # Cleanup services concurrently, mirroring startup
+    logger.info("Stopping background sync, LLM and indexing services")
+    results = await asyncio.gather(
+        sync_service.stop(),
+        llm_service.cleanup(),
+        indexing_service.cleanup(),
+        return_exceptions=True,
+    )
+    for name, result in zip(("sync", "LLM", "indexing"), results):
+        if isinstance(result, BaseException):
+            logger.error("Error stopping %s service: %s", name, str(result))
+
+
+def _add_quick_placeholders(app: FastAPI) -> None:
+    """Add lightweight placeholder solution endpoints for quick mode."""
+
+    @app.get(f"{settings.api_v1_prefix}/solutions/search")
+    async def search_solutions() -> List[Dict[str, Any]]:
+        """Simple solutions search placeholder."""
+        return [{
+            "id": "quick-start-1",
+            "title": "System Starting Up",
+            "score": 1.0,
+            "message": "Full search capabilities will be available once all services are loaded."
+        }]
+
+    @app.get(f"{settings.api_v1_prefix}/solutions/stats")
+    async def solutions_stats() -> Dict[str, Any]:
+        """Simple solutions stats placeholder."""
+        return {
+            "total_documents": "Loading...",
+            "collection_name": settings.chroma_collection_name,
+            "status": "Quick start mode - full indexing available after complete startup"
+        }
+
+
+def setup_exception_handlers(app: FastAPI) -> None:
+    """Setup custom exception handlers."""
+
+    @app.exception_handler(SolarWindsChatbotException)
+    async def custom_exception_handler(
+        request: Request, exc: SolarWindsChatbotException
+    ) -> JSONResponse:
+        """Handle custom application exceptions."""
+        logger.error(
+            "Application error: %s",
+            exc.message,
+            extra={
+                "url": str(request.url),
+                "method": request.method,
+                "details": exc.details,
+                "status_code": exc.status_code,
+            }
+        )
+
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "error": exc.message,
+                "details": exc.details,
+                "status_code": exc.status_code,
+            }
+        )
+
+    @app.exception_handler(Exception)
+    async def general_exception_handler(
+        request: Request, exc: Exception
+    ) -> JSONResponse:
+        """Handle unexpected exceptions."""
+        logger.exception(
+            "Unexpected error occurred",
+            extra={
+                "url": str(request.url),
+                "method": request.method,
+                "error_type": type(exc).__name__,
+            }
+        )
+
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={
+                "error": "Internal server error",
+                "details": {} if not settings.debug else {"message": str(exc)},
+                "status_code": 500,
+            }
+        )
+
+
+def create_application(mode: AppMode = "full") -> FastAPI:
+    """
+    Create and configure a FastAPI application.
+
+    Args:
+        mode: "full" runs the complete service stack with lifespan
+            startup, "simple" mounts the same routers without lifespan,
+            "quick" mounts only lightweight routers with placeholders
+
+    Returns:
+        Configured FastAPI application
+    """
+    quick = mode == "quick"
+
+    app = FastAPI(
+        title=settings.app_name + (" (Quick Start)" if quick else ""),
+        description=(
+            "IT Solutions Chatbot - Quick Start Mode" if quick
+            else "IT Solutions Chatbot with RAG-powered SolarWinds integration"
+        ),
+        version="1.0.0-quick" if quick else "1.0.0",
+        docs_url="/docs" if (quick or settings.debug) else None,
+        redoc_url="/redoc" if (quick or settings.debug) else None,
+        lifespan=lifespan if mode == "full" else None,
+        default_response_class=ORJSONResponse,
+    )
+
+    # CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origin_regex=settings.cors_origin_regex,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Include routers for this mode
+    for module_path, tag in _MODE_ROUTERS[mode]:
+        app.include_router(
+            importlib.import_module(module_path).router,
+            prefix=settings.api_v1_prefix,
+            tags=[tag],
+        )
+
+    if quick:
+        _add_quick_placeholders(app)
+
+    setup_exception_handlers(app)
+
+    # Root endpoint
+    root_payload = {
+        "message": "SolarWinds IT Solutions Chatbot API",
+        "version": app.version,
+        "docs": "/docs" if (quick or settings.debug) else "Documentation disabled in production",
+    }
+    if mode == "simple":
+        root_payload["message"] += " (Simple Mode)"
+        root_payload["status"] = "running"
+    elif quick:
+        root_payload["message"] += " (Quick Start Mode)"
+        root_payload["status"] = "running"
+        root_payload["mode"] = "quick-start"
+        root_payload["note"] = (
+            "This is a quick-start version with simplified responses. "
+            "For full AI functionality, use the complete deployment."
+        )
+
+    @app.get("/", tags=["root"])
+    async def root() -> dict[str, str]:
+        """Root endpoint."""
+        return root_payload
+
+    logger.info("FastAPI application created successfully (%s mode)", mode)
+
+    return app
@@ -1,36 +1,102 @@
 """Pydantic schemas for API request/response models."""
 
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_serializer, model_validator
+
+
+def _utcnow() -> datetime:
+    """Timezone-aware now; datetime.utcnow is deprecated and slower."""
+    return datetime.now(timezone.utc)
 
 
 class ChatRequest(BaseModel):
     """Chat request schema."""
-    
-    query: str = Field(
+
+    query: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=1, max_length=1000),
+    ] = Field(
         ...,
-        min_length=1,
-        max_length=1000,
         description="User query for the chatbot",
         example="How do I reset the printer spooler service?"
     )
 
 
+class StreamChatRequest(ChatRequest):
+    """Chat request schema for the streaming endpoint with batching knobs."""
+
+    min_batch_size: int = Field(
+        default=1,
+        ge=1,
+        le=500,
+        description="Initial number of tokens coalesced per SSE frame"
+    )
+    max_batch_size: int = Field(
+        default=50,
+        ge=1,
+        le=500,
+        description="Maximum number of tokens coalesced per SSE frame"
+    )
+    flush_ms: int = Field(
+        default=100,
+        ge=1,
+        le=5000,
+        description="Maximum time in milliseconds to hold tokens before flushing"
+    )
+
+    @model_validator(mode="after")
+    def _check_batch_bounds(self) -> "StreamChatRequest":
+        """Reject inverted batching bounds; the adaptive window grows from min to max."""
+        if self.min_batch_size > self.max_batch_size:
+            raise ValueError("min_batch_size must not exceed max_batch_size")
+        return self
+
+
+class BatchSearchRequest(BaseModel):
+    """Batch search request schema for the solutions search-batch endpoint."""
+
+    queries: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="Search queries to run in one batch"
+    )
+    limit: int = Field(default=10, ge=1, le=50, description="Maximum number of results per query")
+    category: Optional[str] = Field(None, description="Optional category filter")
+    min_score: float = Field(default=0.0, ge=0.0, le=1.0, description="Minimum similarity score")
+
+
 class SourceDoc(BaseModel):
     """Source document reference schema."""
-    
+
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
     id: str = Field(..., description="Solution document ID")
-    title: str = Field(..., description="Solution title") 
+    title: str = Field(..., description="Solution title")
     score: float = Field(..., ge=0.0, le=1.0, description="Relevance score")
     category: Optional[str] = Field(None, description="Solution category")
     url: Optional[str] = Field(None, description="Link to original solution")
 
+    @classmethod
+    def construct_trusted(
+        cls,
+        id: str,
+        title: str,
+        score: float,
+        category: Optional[str] = None,
+        url: Optional[str] = None,
+    ) -> "SourceDoc":
+        """Build a SourceDoc from trusted vector-store data, skipping validation."""
+        return cls.model_construct(id=id, title=title, score=score, category=category, url=url)
+
 
 class ChatResponse(BaseModel):
     """Chat response schema."""
-    
+
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
     answer: str = Field(..., description="Generated answer from the chatbot")
     sources: List[SourceDoc] = Field(
         default_factory=list,
@@ -42,7 +108,9 @@ class ChatResponse(BaseModel):
 
 class SolutionRecord(BaseModel):
     """Solution record schema for vector store metadata."""
-    
+
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
     id: str = Field(..., description="Unique solution identifier")
     title: str = Field(..., description="Solution title")
     category: str = Field(..., description="Solution category")
@@ -50,11 +118,10 @@ class SolutionRecord(BaseModel):
     updated_at: datetime = Field(..., description="Last updated timestamp")
     tags: List[str] = Field(default_factory=list, description="Solution tags")
     url: Optional[str] = Field(None, description="Original solution URL")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+
+    @field_serializer("updated_at")
+    def _serialize_updated_at(self, value: datetime) -> str:
+        return value.isoformat()
 
 
 class SyncStatus(BaseModel):
@@ -73,4 +140,4 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error message")
     details: dict = Field(default_factory=dict, description="Additional error details")
     status_code: int = Field(..., description="HTTP status code")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Error timestamp")
\ No newline at end of file
+    timestamp: datetime = Field(default_factory=_utcnow, description="Error timestamp")
\ No newline at end of file
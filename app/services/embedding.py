@@ -1,13 +1,19 @@
 """Embedding service with OpenAI and local Sentence-Transformers support."""
 
 import asyncio
-import hashlib
 import json
-import time
-from typing import Dict, List, Optional, Any, Union
-from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Final, List, Optional, Any, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
 
+import lmdb
+import msgspec
+import numpy as np
 import openai
+import torch
+import xxhash
 from sentence_transformers import SentenceTransformer
 
 from app.core.config import settings
@@ -17,51 +23,259 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 
 
+def quantize(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Quantize a float vector to int8 with a symmetric per-vector scale."""
+    scale = float(np.abs(vector).max()) or 1.0
+    return np.round(vector / scale * 127.0).astype(np.int8), scale
+
+
+def dequantize(vector: np.ndarray, scale: float) -> np.ndarray:
+    """Reconstruct an approximate float32 vector from its int8 form."""
+    return vector.astype(np.float32) * (scale / 127.0)
+
+
 class EmbeddingCache:
-    """Simple in-memory cache for embeddings."""
-    
-    def __init__(self, max_size: int = 1000):
-        self.cache: Dict[str, List[float]] = {}
-        self.timestamps: Dict[str, float] = {}
+    """In-memory LRU cache for embeddings backed by a packed matrix.
+
+    With cache_quantization=int8 entries are stored as int8 plus one
+    float32 scale per row (4x smaller than fp32) and dequantized on read.
+    """
+
+    def __init__(self, max_size: int = 1000, dimension: Optional[int] = None):
         self.max_size = max_size
-        
-    def _get_cache_key(self, text: str, model: str) -> str:
+        self.dimension = dimension or settings.embedding_dimension
+        self.quantized = settings.cache_quantization == "int8"
+        # One contiguous matrix instead of per-entry Python lists;
+        # entries map to (row, dim) so narrower fallback vectors fit too
+        self.matrix = np.empty(
+            (max_size, self.dimension),
+            dtype=np.int8 if self.quantized else np.float32,
+        )
+        self.scales = np.empty(max_size, dtype=np.float32) if self.quantized else None
+        self.key_to_row: OrderedDict[int, Tuple[int, int]] = OrderedDict()
+        self.free_rows: Deque[int] = deque(range(max_size))
+        # Reads stay lock-free (dict gets are atomic under the GIL);
+        # only writers serialize, so eviction and row recycling cannot
+        # interleave across threads
+        self._write_lock = threading.Lock()
+        self._hit_count = 0
+        self._total_requests = 0
+
+    def _get_cache_key(self, text: str, model: str) -> int:
         """Generate cache key for text and model."""
-        content = f"{model}:{text}"
-        return hashlib.md5(content.encode()).hexdigest()
-    
-    def get(self, text: str, model: str) -> Optional[List[float]]:
+        # xxh3 over raw bytes is far cheaper than MD5, and an int key
+        # skips the string hashing the dict would otherwise redo
+        return xxhash.xxh3_64_intdigest(model.encode() + b"\x00" + text.encode())
+
+    def get(self, text: str, model: str) -> Optional[np.ndarray]:
         """Get embedding from cache."""
         key = self._get_cache_key(text, model)
-        return self.cache.get(key)
-    
-    def set(self, text: str, model: str, embedding: List[float]) -> None:
+        self._total_requests += 1
+        entry = self.key_to_row.get(key)
+        if entry is None:
+            return None
+
+        # Mark as most recently used
+        self.key_to_row.move_to_end(key)
+        self._hit_count += 1
+        row, dim = entry
+        if self.quantized:
+            return dequantize(self.matrix[row, :dim], float(self.scales[row]))
+        # Copy so LRU row recycling can't mutate vectors already handed out
+        return self.matrix[row, :dim].copy()
+
+    def set(self, text: str, model: str, embedding: Union[List[float], np.ndarray]) -> None:
         """Store embedding in cache."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        dim = vector.shape[-1]
+        if dim > self.dimension:
+            # Wider than the backing matrix; skip rather than truncate
+            return
+
         key = self._get_cache_key(text, model)
-        
-        # Remove oldest entries if cache is full
-        if len(self.cache) >= self.max_size:
-            oldest_key = min(self.timestamps.keys(), key=self.timestamps.get)
-            del self.cache[oldest_key]
-            del self.timestamps[oldest_key]
-        
-        self.cache[key] = embedding
-        self.timestamps[key] = time.time()
-    
+        with self._write_lock:
+            entry = self.key_to_row.get(key)
+            if entry is not None:
+                row = entry[0]
+                self.key_to_row.move_to_end(key)
+            elif self.free_rows:
+                row = self.free_rows.popleft()
+            else:
+                # Evict the least recently used entry and recycle its row
+                _, (row, _) = self.key_to_row.popitem(last=False)
+
+            if self.quantized:
+                self.matrix[row, :dim], self.scales[row] = quantize(vector)
+            else:
+                self.matrix[row, :dim] = vector
+            self.key_to_row[key] = (row, dim)
+
+    def get_many(self, texts: List[str], model: str) -> List[Optional[np.ndarray]]:
+        """Look up many texts in one pass.
+
+        Hoists the dict, matrix, and hashing out of the loop so a batch
+        lookup costs one dict probe per item instead of a full get() call.
+        """
+        model_prefix = model.encode() + b"\x00"
+        key_to_row = self.key_to_row
+        matrix = self.matrix
+        scales = self.scales
+        quantized = self.quantized
+
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        hits = 0
+        for j, text in enumerate(texts):
+            key = xxhash.xxh3_64_intdigest(model_prefix + text.encode())
+            entry = key_to_row.get(key)
+            if entry is None:
+                continue
+            key_to_row.move_to_end(key)
+            hits += 1
+            row, dim = entry
+            if quantized:
+                results[j] = dequantize(matrix[row, :dim], float(scales[row]))
+            else:
+                # Copy: a view would alias the row if eviction recycles it
+                results[j] = matrix[row, :dim].copy()
+
+        self._total_requests += len(texts)
+        self._hit_count += hits
+        return results
+
+    def partition(
+        self, texts: List[str], model: str
+    ) -> Tuple[List[Optional[np.ndarray]], List[int], List[str]]:
+        """Split a batch into hits and misses in a single pass.
+
+        Same loop as get_many, but the misses come back as ready-to-use
+        index and text lists so the batch path gets its provider work
+        list without rescanning the results.
+        """
+        model_prefix = model.encode() + b"\x00"
+        key_to_row = self.key_to_row
+        matrix = self.matrix
+        scales = self.scales
+        quantized = self.quantized
+
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        miss_indices: List[int] = []
+        miss_texts: List[str] = []
+        hits = 0
+        for j, text in enumerate(texts):
+            key = xxhash.xxh3_64_intdigest(model_prefix + text.encode())
+            entry = key_to_row.get(key)
+            if entry is None:
+                miss_indices.append(j)
+                miss_texts.append(text)
+                continue
+            key_to_row.move_to_end(key)
+            hits += 1
+            row, dim = entry
+            if quantized:
+                results[j] = dequantize(matrix[row, :dim], float(scales[row]))
+            else:
+                # Copy: a view would alias the row if eviction recycles it
+                results[j] = matrix[row, :dim].copy()
+
+        self._total_requests += len(texts)
+        self._hit_count += hits
+        return results, miss_indices, miss_texts
+
     def clear(self) -> None:
         """Clear the cache."""
-        self.cache.clear()
-        self.timestamps.clear()
-    
+        with self._write_lock:
+            self.key_to_row.clear()
+            self.free_rows = deque(range(self.max_size))
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         return {
-            "size": len(self.cache),
+            "size": len(self.key_to_row),
             "max_size": self.max_size,
-            "hit_rate": getattr(self, "_hit_count", 0) / max(getattr(self, "_total_requests", 1), 1),
+            "hit_rate": self._hit_count / max(self._total_requests, 1),
         }
 
 
+class PersistentEmbeddingCache(EmbeddingCache):
+    """EmbeddingCache with an LMDB tier that survives restarts.
+
+    Misses in the in-memory LRU fall through to a memory-mapped LMDB
+    database and hits hydrate back into the LRU, so repeat queries keep
+    their embeddings across worker restarts instead of being recomputed.
+    Values are stored as int8 plus scale, msgpack-encoded with msgspec.
+    """
+
+    def __init__(self, path: str, max_size: int = 1000, dimension: Optional[int] = None):
+        super().__init__(max_size=max_size, dimension=dimension)
+        os.makedirs(path, exist_ok=True)
+        self.env = lmdb.open(path, map_size=1 << 30)
+
+    def _persistent_key(self, text: str, model: str) -> bytes:
+        return self._get_cache_key(text, model).to_bytes(8, "big")
+
+    def get(self, text: str, model: str) -> Optional[np.ndarray]:
+        """Get embedding from the in-memory LRU, then the LMDB tier."""
+        embedding = super().get(text, model)
+        if embedding is not None:
+            return embedding
+        return self._get_persistent(text, model)
+
+    def get_many(self, texts: List[str], model: str) -> List[Optional[np.ndarray]]:
+        """Look up many texts, falling through to LMDB for LRU misses."""
+        results = super().get_many(texts, model)
+        for j, result in enumerate(results):
+            if result is None:
+                results[j] = self._get_persistent(texts[j], model)
+        return results
+
+    def partition(
+        self, texts: List[str], model: str
+    ) -> Tuple[List[Optional[np.ndarray]], List[int], List[str]]:
+        """Split a batch into hits and misses, trying LMDB for LRU misses."""
+        results, miss_indices, miss_texts = super().partition(texts, model)
+
+        still_indices: List[int] = []
+        still_texts: List[str] = []
+        for j, text in zip(miss_indices, miss_texts):
+            embedding = self._get_persistent(text, model)
+            if embedding is None:
+                still_indices.append(j)
+                still_texts.append(text)
+            else:
+                results[j] = embedding
+        return results, still_indices, still_texts
+
+    def _get_persistent(self, text: str, model: str) -> Optional[np.ndarray]:
+        """Read one embedding from the LMDB tier and hydrate the LRU."""
+        with self.env.begin() as txn:
+            raw = txn.get(self._persistent_key(text, model))
+        if raw is None:
+            return None
+
+        record = msgspec.msgpack.decode(raw)
+        vector = dequantize(np.frombuffer(record["v"], dtype=np.int8), record["s"])
+
+        # Hydrate into the LRU so the next hit skips the disk tier
+        super().set(text, model, vector)
+        return vector
+
+    def set(self, text: str, model: str, embedding: Union[List[float], np.ndarray]) -> None:
+        """Store embedding in both the LRU and the LMDB tier."""
+        super().set(text, model, embedding)
+
+        quantized, scale = quantize(np.asarray(embedding, dtype=np.float32))
+        payload = msgspec.msgpack.encode({"v": quantized.tobytes(), "s": scale})
+        with self.env.begin(write=True) as txn:
+            txn.put(self._persistent_key(text, model), payload)
+
+    def clear(self) -> None:
+        """Clear both tiers."""
+        super().clear()
+        db = self.env.open_db()
+        with self.env.begin(write=True) as txn:
+            txn.drop(db, delete=False)
+
+
 class OpenAIEmbeddingProvider:
     """OpenAI embedding provider."""
     
@@ -81,18 +295,18 @@ class OpenAIEmbeddingProvider:
         
         logger.info(f"Initialized OpenAI embedding provider with model: {self.model}")
     
-    async def get_embedding(self, text: str) -> List[float]:
+    async def get_embedding(self, text: str) -> np.ndarray:
         """Get embedding for a single text."""
         if not self.client:
             raise EmbeddingError("OpenAI client not initialized")
-        
+
         try:
             response = await self.client.embeddings.create(
                 input=text,
                 model=self.model
             )
-            
-            embedding = response.data[0].embedding
+
+            embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
             
             logger.debug(f"Generated OpenAI embedding", extra={
                 "text_length": len(text),
@@ -106,18 +320,26 @@ class OpenAIEmbeddingProvider:
             logger.error(f"OpenAI embedding error: {str(e)}")
             raise EmbeddingError(f"OpenAI embedding failed: {str(e)}")
     
-    async def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+    async def get_embeddings_batch(self, texts: List[str]) -> List[np.ndarray]:
         """Get embeddings for multiple texts."""
         if not self.client:
             raise EmbeddingError("OpenAI client not initialized")
-        
+
         try:
+            # Send the batch length-sorted so similarly sized texts are
+            # tokenized together, then scatter results back to input order
+            order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+
             response = await self.client.embeddings.create(
-                input=texts,
+                input=[texts[i] for i in order],
                 model=self.model
             )
-            
-            embeddings = [item.embedding for item in response.data]
+
+            embeddings: List[np.ndarray] = [None] * len(texts)  # type: ignore[list-item]
+            for item in response.data:
+                embeddings[order[item.index]] = np.asarray(
+                    item.embedding, dtype=np.float32
+                )
             
             logger.info(f"Generated {len(embeddings)} OpenAI embeddings in batch")
             
@@ -128,104 +350,246 @@ class OpenAIEmbeddingProvider:
             raise EmbeddingError(f"OpenAI batch embedding failed: {str(e)}")
 
 
+# Per-worker model for the CPU encoding process pool; loaded once by the
+# pool initializer so only text lists and result arrays cross the boundary
+_worker_model: Optional[SentenceTransformer] = None
+
+
+def _init_encode_worker(model_name: str, num_threads: int) -> None:
+    """Load the model in an encoding worker process (pool initializer)."""
+    global _worker_model
+    torch.set_num_threads(num_threads)
+    _worker_model = SentenceTransformer(model_name, device="cpu")
+
+
+def _encode_in_worker(texts: List[str], batch_size: int = 64) -> np.ndarray:
+    """Encode texts with the worker-local model."""
+    return _worker_model.encode(
+        texts,
+        batch_size=batch_size,
+        normalize_embeddings=True,
+        convert_to_numpy=True,
+        show_progress_bar=False,
+    )
+
+
 class LocalEmbeddingProvider:
     """Local Sentence-Transformers embedding provider."""
-    
+
+    # How long single-text requests wait to be merged into one encode call
+    _COALESCE_WINDOW_S: Final = 0.005
+
     def __init__(self):
         self.model: Optional[SentenceTransformer] = None
         self.model_name = "all-MiniLM-L6-v2"  # Fast and efficient model
-        self.executor = ThreadPoolExecutor(max_workers=2)
-        
+        self.device: Optional[str] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    @property
+    def available(self) -> bool:
+        """Whether the provider can serve encode requests."""
+        return self.model is not None or self._process_pool is not None
+
     async def initialize(self) -> None:
         """Initialize the local model."""
         try:
-            loop = asyncio.get_event_loop()
-            
-            # Load model in thread pool (it's CPU intensive)
-            self.model = await loop.run_in_executor(
-                self.executor,
-                self._load_model
+            loop = asyncio.get_running_loop()
+
+            if settings.embedding_device != "auto":
+                self.device = settings.embedding_device
+            else:
+                self.device = "cuda" if torch.cuda.is_available() else "cpu"
+
+            if self.device == "cpu":
+                # Threaded encoding contends on the GIL for tokenization
+                # and postprocessing; a process pool gets real parallelism.
+                # Each worker caps torch's intra-op threads so the pool
+                # does not oversubscribe the machine.
+                workers = max(1, settings.embed_workers)
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_encode_worker,
+                    initargs=(self.model_name, max(1, (os.cpu_count() or 1) // workers)),
+                )
+                # Warmup so the first worker loads the model now and any
+                # load failure surfaces during startup
+                await loop.run_in_executor(
+                    self._process_pool,
+                    _encode_in_worker,
+                    ["How do I reset the printer spooler service?"]
+                )
+            else:
+                # Load model in the default executor (it's CPU intensive)
+                self.model = await loop.run_in_executor(
+                    None,
+                    self._load_model
+                )
+
+                # One-time warmup encode pays the compile cost at startup
+                # instead of on the first request
+                await loop.run_in_executor(
+                    None,
+                    self._encode_texts_batch,
+                    ["How do I reset the printer spooler service?"]
+                )
+
+            logger.info(
+                f"Initialized local embedding provider with model: {self.model_name} "
+                f"on device: {self.device}"
             )
-            
-            logger.info(f"Initialized local embedding provider with model: {self.model_name}")
-            
+
         except Exception as e:
             logger.error(f"Failed to initialize local embedding model: {str(e)}")
             raise EmbeddingError(f"Local embedding initialization failed: {str(e)}")
-    
+
     def _load_model(self) -> SentenceTransformer:
         """Load the Sentence-Transformers model (sync operation)."""
-        return SentenceTransformer(self.model_name)
+        model = SentenceTransformer(self.model_name, device=self.device)
+
+        if self.device == "cuda":
+            # Fuse the transformer+pooling kernels and capture CUDA graphs
+            # for fixed batch shapes, skipping per-layer Python dispatch
+            try:
+                model[0].auto_model = torch.compile(
+                    model[0].auto_model, mode="reduce-overhead"
+                )
+            except Exception as e:
+                logger.warning(f"torch.compile unavailable, running eager: {str(e)}")
+
+        return model
     
-    async def get_embedding(self, text: str) -> List[float]:
-        """Get embedding for a single text."""
-        if not self.model:
+    async def get_embedding(self, text: str) -> np.ndarray:
+        """Get embedding for a single text.
+
+        Concurrent single-text calls within a short window are coalesced
+        into one batched encode, so N parallel requests cost one forward
+        pass instead of N serialized ones.
+        """
+        if not self.available:
             raise EmbeddingError("Local embedding model not initialized")
-        
+
         try:
-            loop = asyncio.get_event_loop()
-            
-            embedding = await loop.run_in_executor(
-                self.executor,
-                self._encode_text,
-                text
-            )
-            
+            loop = asyncio.get_running_loop()
+            future: asyncio.Future = loop.create_future()
+            self._pending.append((text, future))
+
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_pending())
+
+            embedding = await future
+
             logger.debug(f"Generated local embedding", extra={
                 "text_length": len(text),
                 "embedding_dimension": len(embedding),
                 "model": self.model_name,
             })
-            
-            return embedding.tolist()
-            
+
+            return np.asarray(embedding, dtype=np.float32)
+
         except Exception as e:
             logger.error(f"Local embedding error: {str(e)}")
             raise EmbeddingError(f"Local embedding failed: {str(e)}")
+
+    async def _flush_pending(self) -> None:
+        """Encode all requests gathered during the coalescing window."""
+        await asyncio.sleep(self._COALESCE_WINDOW_S)
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        try:
+            embeddings = await self._run_encode([text for text, _ in batch])
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(
+                        EmbeddingError(f"Local embedding failed: {str(e)}")
+                    )
     
-    def _encode_text(self, text: str):
-        """Encode text using the model (sync operation)."""
-        return self.model.encode(text)
-    
-    async def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+    async def get_embeddings_batch(self, texts: List[str]) -> List[np.ndarray]:
         """Get embeddings for multiple texts."""
-        if not self.model:
+        if not self.available:
             raise EmbeddingError("Local embedding model not initialized")
-        
+
         try:
-            loop = asyncio.get_event_loop()
-            
-            embeddings = await loop.run_in_executor(
-                self.executor,
-                self._encode_texts_batch,
-                texts
-            )
-            
+            embeddings = await self._run_encode(texts)
+
             logger.info(f"Generated {len(embeddings)} local embeddings in batch")
-            
-            return [emb.tolist() for emb in embeddings]
-            
+
+            return list(np.asarray(embeddings, dtype=np.float32))
+
         except Exception as e:
             logger.error(f"Local batch embedding error: {str(e)}")
             raise EmbeddingError(f"Local batch embedding failed: {str(e)}")
-    
-    def _encode_texts_batch(self, texts: List[str]):
+
+    async def _run_encode(self, texts: List[str]) -> np.ndarray:
+        """Dispatch an encode to the process pool or the loop executor."""
+        loop = asyncio.get_running_loop()
+        if self._process_pool is not None:
+            return await loop.run_in_executor(self._process_pool, _encode_in_worker, texts)
+        return await loop.run_in_executor(None, self._encode_texts_batch, texts)
+
+    def _encode_texts_batch(self, texts: List[str], batch_size: int = 64):
         """Encode multiple texts using the model (sync operation)."""
-        return self.model.encode(texts)
+        # convert_to_numpy avoids the tensor->list->float round-trip;
+        # normalization is fused into the encode pass so cosine
+        # similarity downstream reduces to a dot product. encode()
+        # length-sorts sentences internally, so each mini-batch pads
+        # only to its own longest member (SBERT smart batching)
+        try:
+            return self.model.encode(
+                texts,
+                batch_size=batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            )
+        except torch.cuda.OutOfMemoryError:
+            if batch_size <= 1:
+                raise
+            # Shrink the batch and retry rather than failing the request
+            torch.cuda.empty_cache()
+            logger.warning(
+                f"CUDA out of memory during encode, retrying with batch_size={batch_size // 2}"
+            )
+            return self._encode_texts_batch(texts, batch_size // 2)
     
     def cleanup(self) -> None:
         """Cleanup resources."""
-        if self.executor:
-            self.executor.shutdown(wait=True)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True)
+            self._process_pool = None
+        self.model = None
 
 
 class EmbeddingService:
-    """Main embedding service with provider fallback and caching."""
+    """Main embedding service with provider fallback and caching.
+
+    Returned vectors are unit-length: OpenAI embeddings arrive normalized
+    and the local provider normalizes inside the encode pass, so cosine
+    similarity downstream is a plain dot / inner product.
+    """
     
     def __init__(self):
         self.openai_provider = OpenAIEmbeddingProvider()
         self.local_provider = LocalEmbeddingProvider()
-        self.cache = EmbeddingCache()
+        self.cache: EmbeddingCache
+        if settings.embedding_cache_path:
+            try:
+                self.cache = PersistentEmbeddingCache(settings.embedding_cache_path)
+            except Exception as e:
+                # A read-only filesystem should not take the service down;
+                # fall back to the in-memory tier only
+                logger.warning(f"Persistent embedding cache unavailable: {str(e)}")
+                self.cache = EmbeddingCache()
+        else:
+            self.cache = EmbeddingCache()
         self.primary_provider = settings.embedding_provider
         self._initialized = False
         
@@ -270,7 +634,7 @@ class EmbeddingService:
             logger.error(f"Failed to initialize embedding service: {str(e)}")
             raise EmbeddingError(f"Embedding service initialization failed: {str(e)}")
     
-    async def get_embedding(self, text: str, use_cache: bool = True) -> List[float]:
+    async def get_embedding(self, text: str, use_cache: bool = True) -> np.ndarray:
         """
         Get embedding for a single text.
         
@@ -292,7 +656,7 @@ class EmbeddingService:
         # Check cache first
         if use_cache:
             cached_embedding = self.cache.get(text, self.primary_provider)
-            if cached_embedding:
+            if cached_embedding is not None:
                 return cached_embedding
         
         # Try primary provider
@@ -324,7 +688,7 @@ class EmbeddingService:
                 logger.error(f"Both providers failed. Primary: {str(e)}, Fallback: {str(fallback_error)}")
                 raise EmbeddingError(f"All embedding providers failed: {str(e)}")
     
-    async def _get_embedding_with_provider(self, text: str, provider: str) -> List[float]:
+    async def _get_embedding_with_provider(self, text: str, provider: str) -> np.ndarray:
         """Get embedding using a specific provider."""
         if provider == "openai":
             return await self.openai_provider.get_embedding(text)
@@ -334,110 +698,121 @@ class EmbeddingService:
             raise EmbeddingError(f"Unknown provider: {provider}")
     
     async def get_embeddings_batch(
-        self, 
-        texts: List[str], 
+        self,
+        texts: List[str],
         use_cache: bool = True,
-        batch_size: int = 50
-    ) -> List[List[float]]:
+        batch_size: int = 256
+    ) -> List[np.ndarray]:
         """
         Get embeddings for multiple texts.
-        
+
         Args:
             texts: List of texts to embed
             use_cache: Whether to use caching
             batch_size: Maximum batch size for API calls
-            
+
         Returns:
             List of embedding vectors
         """
         if not self._initialized:
             await self.initialize()
-        
+
         if not texts:
             return []
-        
+
         # Clean texts
         texts = [text.strip() for text in texts if text.strip()]
-        
-        embeddings = []
-        
-        # Process in batches
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            
-            # Check cache for batch items
-            batch_embeddings = []
-            uncached_texts = []
-            uncached_indices = []
-            
-            if use_cache:
-                for j, text in enumerate(batch):
-                    cached = self.cache.get(text, self.primary_provider)
-                    if cached:
-                        batch_embeddings.append((j, cached))
-                    else:
-                        uncached_texts.append(text)
-                        uncached_indices.append(j)
-            else:
-                uncached_texts = batch
-                uncached_indices = list(range(len(batch)))
-            
-            # Get embeddings for uncached texts
-            if uncached_texts:
+
+        # Resolve cache hits first so only the misses hit a provider.
+        # Every result is written straight into its output slot, so no
+        # sort or per-item tuple bookkeeping is needed at the end
+        if use_cache:
+            # One fused pass over the batch: hash, probe, and collect
+            # the provider work list together
+            embeddings, uncached_indices, uncached_texts = self.cache.partition(
+                texts, self.primary_provider
+            )
+        else:
+            embeddings = [None] * len(texts)
+            uncached_texts = texts
+            uncached_indices = list(range(len(texts)))
+
+        if uncached_texts:
+            # Collapse duplicate texts (chunk boilerplate, repeated
+            # queries) so each unique string is embedded exactly once
+            first_seen: Dict[str, int] = {}
+            unique_texts: List[str] = []
+            unique_positions: List[int] = []
+            for text in uncached_texts:
+                position = first_seen.get(text)
+                if position is None:
+                    position = len(unique_texts)
+                    first_seen[text] = position
+                    unique_texts.append(text)
+                unique_positions.append(position)
+
+            try:
+                new_embeddings = await self._get_embeddings_batch_with_provider(
+                    unique_texts, self.primary_provider, batch_size
+                )
+                provider_used = self.primary_provider
+
+            except Exception as e:
+                logger.warning(f"Batch embedding failed with primary provider: {str(e)}")
+
+                # Try fallback provider
+                fallback_provider = "local" if self.primary_provider == "openai" else "openai"
                 try:
                     new_embeddings = await self._get_embeddings_batch_with_provider(
-                        uncached_texts, self.primary_provider
+                        unique_texts, fallback_provider, batch_size
                     )
-                    
-                    # Cache new embeddings
-                    if use_cache:
-                        for text, embedding in zip(uncached_texts, new_embeddings):
-                            self.cache.set(text, self.primary_provider, embedding)
-                    
-                    # Add to batch results
-                    for idx, embedding in zip(uncached_indices, new_embeddings):
-                        batch_embeddings.append((idx, embedding))
-                        
-                except Exception as e:
-                    logger.warning(f"Batch embedding failed with primary provider: {str(e)}")
-                    
-                    # Try fallback provider
-                    fallback_provider = "local" if self.primary_provider == "openai" else "openai"
-                    try:
-                        new_embeddings = await self._get_embeddings_batch_with_provider(
-                            uncached_texts, fallback_provider
-                        )
-                        
-                        # Cache with fallback provider
-                        if use_cache:
-                            for text, embedding in zip(uncached_texts, new_embeddings):
-                                self.cache.set(text, fallback_provider, embedding)
-                        
-                        # Add to batch results
-                        for idx, embedding in zip(uncached_indices, new_embeddings):
-                            batch_embeddings.append((idx, embedding))
-                            
-                        logger.info(f"Successfully used fallback provider for batch: {fallback_provider}")
-                        
-                    except Exception as fallback_error:
-                        logger.error(f"Batch embedding failed with both providers: {str(e)}, {str(fallback_error)}")
-                        raise EmbeddingError(f"Batch embedding failed: {str(e)}")
-            
-            # Sort batch embeddings by original index and extract embeddings
-            batch_embeddings.sort(key=lambda x: x[0])
-            embeddings.extend([emb for _, emb in batch_embeddings])
-        
+                    provider_used = fallback_provider
+
+                    logger.info(f"Successfully used fallback provider for batch: {fallback_provider}")
+
+                except Exception as fallback_error:
+                    logger.error(f"Batch embedding failed with both providers: {str(e)}, {str(fallback_error)}")
+                    raise EmbeddingError(f"Batch embedding failed: {str(e)}")
+
+            # Cache new embeddings
+            if use_cache:
+                for text, embedding in zip(unique_texts, new_embeddings):
+                    self.cache.set(text, provider_used, embedding)
+
+            # Fan each unique embedding out to every index that asked for it
+            for idx, position in zip(uncached_indices, unique_positions):
+                embeddings[idx] = new_embeddings[position]
+
         logger.info(f"Generated {len(embeddings)} embeddings in batch")
         return embeddings
-    
+
     async def _get_embeddings_batch_with_provider(
-        self, 
-        texts: List[str], 
-        provider: str
-    ) -> List[List[float]]:
-        """Get batch embeddings using a specific provider."""
+        self,
+        texts: List[str],
+        provider: str,
+        batch_size: int = 256
+    ) -> List[np.ndarray]:
+        """Get batch embeddings using a specific provider.
+
+        OpenAI sub-batches fan out concurrently (bounded by a semaphore)
+        since the endpoint is IO-bound from our side; the local provider
+        takes everything in one call and lets encode() mini-batch.
+        """
         if provider == "openai":
-            return await self.openai_provider.get_embeddings_batch(texts)
+            if len(texts) <= batch_size:
+                return await self.openai_provider.get_embeddings_batch(texts)
+
+            semaphore = asyncio.Semaphore(settings.openai_concurrency)
+
+            async def run_batch(batch: List[str]) -> List[np.ndarray]:
+                async with semaphore:
+                    return await self.openai_provider.get_embeddings_batch(batch)
+
+            chunks = await asyncio.gather(*[
+                run_batch(texts[i:i + batch_size])
+                for i in range(0, len(texts), batch_size)
+            ])
+            return [embedding for chunk in chunks for embedding in chunk]
         elif provider == "local":
             return await self.local_provider.get_embeddings_batch(texts)
         else:
@@ -448,7 +823,7 @@ class EmbeddingService:
         return {
             "primary_provider": self.primary_provider,
             "openai_available": self.openai_provider.client is not None,
-            "local_available": self.local_provider.model is not None,
+            "local_available": self.local_provider.available,
             "cache_stats": self.cache.get_stats(),
             "embedding_dimension": settings.embedding_dimension,
             "initialized": self._initialized,
@@ -1,9 +1,15 @@
 """Solution indexing service that integrates embedding and vector store services."""
 
 import asyncio
+import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
+import numpy as np
+
+from app.core.config import settings
 from app.core.exceptions import VectorStoreError, EmbeddingError
 from app.core.logging import get_logger
 from app.models.schemas import SolutionRecord, SourceDoc
@@ -14,27 +20,96 @@ from app.services.text_processing import text_processing_service
 logger = get_logger(__name__)
 
 
+# Matches the minimum validate_content enforces after cleaning; raw
+# content below this can never pass
+_MIN_CONTENT_LEN = 50
+
+
+def _quick_reject(solution: SolutionRecord) -> Optional[str]:
+    """
+    Cheap O(n) scan for records that can never survive validation.
+
+    Catches the obvious junk (empty titles, too-short or all-whitespace
+    content) before the expensive Unstructured processing and embedding
+    run, returning the rejection reason or None to proceed.
+    """
+    content = solution.content
+    if len(content) < _MIN_CONTENT_LEN:
+        return "content too short"
+    if not solution.title.strip():
+        return "empty title"
+    if sum(c.isspace() for c in content) / len(content) > 0.98:
+        return "content is almost entirely whitespace"
+    return None
+
+
+def _make_embed_text(title: str, content: str) -> str:
+    """Build the text embedded for a solution: title, blank line, content.
+
+    One shared helper keeps the format in a single place and compiles to
+    a single string allocation per record.
+    """
+    return title + "\n\n" + content
+
+
+def _l2_normalize(matrix: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize each row of an (N, D) matrix in place.
+
+    Normalizing once at ingest keeps every stored vector unit-length, so
+    cosine scoring downstream reduces to a plain inner product and the
+    per-query renormalization of cached document matrices is a numeric
+    no-op. Runs as a single vectorized pass in C.
+    """
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    matrix /= norms
+    return matrix
+
+
 class IndexingService:
     """Service for indexing solutions into the vector store with embeddings."""
-    
+
+    # Popular queries (autocomplete, re-renders) repeat often; 1024
+    # float32 vectors is at most a few MB
+    _QUERY_CACHE_MAX = 1024
+
     def __init__(self):
-        self._initialized = False
-        
+        # LRU of normalized query -> embedding; unlike the embedding
+        # service's exact-text cache this folds case so "Printer" and
+        # "printer" share a vector
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._query_cache_lock = asyncio.Lock()
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
+        # Set once initialize() completes; hot paths check it with a
+        # single is_set() instead of re-entering initialize()
+        self._ready = asyncio.Event()
+        # Warm up eagerly when constructed inside a running loop; the
+        # module-level instance is built at import time and falls back
+        # to lazy initialization on first use
+        try:
+            asyncio.get_running_loop().create_task(self.initialize())
+        except RuntimeError:
+            pass
+
     async def initialize(self) -> None:
         """Initialize the indexing service and its dependencies."""
-        if self._initialized:
+        if self._ready.is_set():
             return
             
         try:
             logger.info("Initializing indexing service")
-            
-            # Initialize embedding service
-            await embedding_service.initialize()
-            
-            # Initialize vector store
-            await vector_store_service.connect()
-            
-            self._initialized = True
+
+            # Model load and store connection are independent, so run
+            # them together: startup costs the slower of the two, not
+            # the sum. Any failure propagates out of the gather
+            await asyncio.gather(
+                embedding_service.initialize(),
+                vector_store_service.connect(),
+            )
+
+            self._ready.set()
             logger.info("Indexing service initialized successfully")
             
         except Exception as e:
@@ -46,7 +121,7 @@ class IndexingService:
         try:
             await embedding_service.cleanup()
             await vector_store_service.disconnect()
-            self._initialized = False
+            self._ready.clear()
             logger.info("Indexing service cleaned up")
         except Exception as e:
             logger.error(f"Error during indexing service cleanup: {str(e)}")
@@ -54,16 +129,25 @@ class IndexingService:
     async def index_solution(self, solution: SolutionRecord) -> bool:
         """
         Index a single solution into the vector store.
-        
+
         Args:
             solution: Solution record to index
-            
+
         Returns:
             True if successful, False otherwise
         """
-        if not self._initialized:
+        if not self._ready.is_set():
             await self.initialize()
-        
+
+        # Reject obvious junk before paying for processing and embedding
+        reject_reason = _quick_reject(solution)
+        if reject_reason is not None:
+            logger.debug(f"Quick-rejected solution: {solution.title}", extra={
+                "solution_id": solution.id,
+                "reason": reject_reason,
+            })
+            return False
+
         try:
             # Process the solution content
             processed_content = await text_processing_service.process_solution_content(
@@ -71,20 +155,35 @@ class IndexingService:
                 solution.title
             )
             
+            # Create text for embedding (combine title and content)
+            embedding_text = _make_embed_text(solution.title, processed_content)
+
+            # Embedding is the long call and validation rarely fails, so
+            # speculatively start the embedding while validation runs and
+            # discard it on the rare invalid record
+            embed_task: Optional[asyncio.Task] = None
+            if settings.speculative_embedding:
+                embed_task = asyncio.create_task(
+                    embedding_service.get_embedding(embedding_text)
+                )
+
             # Validate content quality
             validation = await text_processing_service.validate_content(processed_content)
             if not validation["is_valid"]:
+                if embed_task is not None:
+                    embed_task.cancel()
+                    await asyncio.gather(embed_task, return_exceptions=True)
                 logger.warning(f"Solution content failed validation: {solution.title}", extra={
                     "issues": validation["issues"],
                     "solution_id": solution.id,
                 })
                 return False
-            
-            # Create text for embedding (combine title and content)
-            embedding_text = f"{solution.title}\n\n{processed_content}"
-            
+
             # Generate embedding
-            embedding = await embedding_service.get_embedding(embedding_text)
+            if embed_task is not None:
+                embedding = await embed_task
+            else:
+                embedding = await embedding_service.get_embedding(embedding_text)
             
             # Update solution with processed content
             enhanced_solution = SolutionRecord(
@@ -100,11 +199,13 @@ class IndexingService:
             # Store in vector database
             await vector_store_service.add_solution(enhanced_solution, embedding)
             
-            logger.info(f"Successfully indexed solution: {solution.title}", extra={
-                "solution_id": solution.id,
-                "content_length": len(processed_content),
-                "embedding_dimension": len(embedding),
-            })
+            # Build the extra dict only when INFO will actually be emitted
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Successfully indexed solution: {solution.title}", extra={
+                    "solution_id": solution.id,
+                    "content_length": len(processed_content),
+                    "embedding_dimension": len(embedding),
+                })
             
             return True
             
@@ -116,90 +217,167 @@ class IndexingService:
             return False
     
     async def index_solutions_batch(
-        self, 
+        self,
         solutions: List[SolutionRecord],
-        batch_size: int = 10
+        batch_size: int = 10,
+        max_in_flight: int = 5
     ) -> Dict[str, Any]:
         """
         Index multiple solutions in batch.
-        
+
+        Runs as a three-stage process -> embed -> upsert pipeline joined
+        by bounded queues, so text processing for one group overlaps the
+        embedding of the previous group and the vector store write of
+        the one before that. Memory stays proportional to the group
+        size, not the ingest size.
+
         Args:
             solutions: List of solutions to index
             batch_size: Number of solutions to process concurrently
-            
+            max_in_flight: Maximum concurrent embedding sub-batches
+
         Returns:
             Dictionary with indexing results
         """
-        if not self._initialized:
+        if not self._ready.is_set():
             await self.initialize()
         
         if not solutions:
             return {"indexed": 0, "failed": 0, "skipped": 0}
         
-        start_time = datetime.utcnow()
+        # Monotonic clock: cheaper than datetime and immune to wall-clock steps
+        start_time = time.perf_counter()
         indexed_count = 0
         failed_count = 0
         skipped_count = 0
         
         logger.info(f"Starting batch indexing of {len(solutions)} solutions")
-        
-        try:
-            # Process solutions with text processing first
-            processed_solutions = await text_processing_service.batch_process_solutions(
-                [sol.model_dump() for sol in solutions],
-                batch_size=batch_size
-            )
-            
-            # Filter valid solutions and prepare for embedding
-            valid_solutions = []
-            embedding_texts = []
-            
-            for processed_sol in processed_solutions:
-                validation = processed_sol.get("content_validation", {})
-                if validation.get("is_valid", True):
-                    # Create solution record
-                    solution = SolutionRecord(
-                        id=processed_sol["id"],
-                        title=processed_sol["title"],
-                        category=processed_sol["category"],
-                        content=processed_sol["processed_content"],
-                        updated_at=datetime.fromisoformat(processed_sol["updated_at"]) if isinstance(processed_sol["updated_at"], str) else processed_sol["updated_at"],
-                        tags=processed_sol.get("tags", []),
-                        url=processed_sol.get("url"),
+
+        # Records resident per pipeline stage; big enough to keep
+        # max_in_flight embedding sub-batches busy within one group
+        group_size = batch_size * max(1, max_in_flight)
+        processed_q: "asyncio.Queue[Optional[Any]]" = asyncio.Queue(maxsize=2)
+        embedded_q: "asyncio.Queue[Optional[Any]]" = asyncio.Queue(maxsize=2)
+
+        async def process_stage() -> None:
+            nonlocal skipped_count
+            try:
+                for start in range(0, len(solutions), group_size):
+                    group = []
+                    for candidate in solutions[start:start + group_size]:
+                        # Reject obvious junk before paying for
+                        # processing and embedding
+                        reject_reason = _quick_reject(candidate)
+                        if reject_reason is None:
+                            group.append(candidate)
+                        else:
+                            skipped_count += 1
+                            logger.debug(
+                                f"Quick-rejected solution: {candidate.title}",
+                                extra={"reason": reject_reason},
+                            )
+                    if not group:
+                        continue
+
+                    pairs = await text_processing_service.batch_process_solutions_records(
+                        group,
+                        batch_size=batch_size
                     )
-                    valid_solutions.append(solution)
-                    
-                    # Prepare text for embedding
-                    embedding_text = f"{solution.title}\n\n{solution.content}"
-                    embedding_texts.append(embedding_text)
-                else:
-                    skipped_count += 1
-                    logger.debug(f"Skipped invalid solution: {processed_sol.get('title', 'Unknown')}")
-            
-            if not valid_solutions:
-                logger.warning("No valid solutions to index")
-                return {"indexed": 0, "failed": 0, "skipped": skipped_count}
-            
-            # Generate embeddings in batch
-            logger.info(f"Generating embeddings for {len(valid_solutions)} solutions")
-            embeddings = await embedding_service.get_embeddings_batch(
-                embedding_texts,
-                batch_size=min(batch_size, 20)  # Limit embedding batch size
-            )
-            
-            # Index solutions in vector store batch
-            await vector_store_service.add_solutions_batch(valid_solutions, embeddings)
-            indexed_count = len(valid_solutions)
-            
-            duration = (datetime.utcnow() - start_time).total_seconds()
-            
-            logger.info(f"Batch indexing completed", extra={
-                "total_solutions": len(solutions),
-                "indexed": indexed_count,
-                "failed": failed_count,
-                "skipped": skipped_count,
-                "duration_seconds": duration,
-            })
+
+                    records: List[SolutionRecord] = []
+                    texts: List[str] = []
+                    for original, processed in pairs:
+                        validation = processed.get("content_validation", {})
+                        if validation.get("is_valid", True):
+                            # Reuse the original record, swapping in the
+                            # cleaned content
+                            record = original.model_copy(
+                                update={"content": processed["processed_content"]}
+                            )
+                            records.append(record)
+                            texts.append(_make_embed_text(record.title, record.content))
+                        else:
+                            skipped_count += 1
+                            logger.debug(f"Skipped invalid solution: {original.title}")
+
+                    if records:
+                        await processed_q.put((records, texts))
+            finally:
+                # Always deliver the sentinel so downstream stages drain
+                # even when this stage fails
+                await processed_q.put(None)
+
+        async def embed_stage() -> None:
+            try:
+                while (item := await processed_q.get()) is not None:
+                    records, texts = item
+
+                    # Embed each distinct text once; ingest dumps often
+                    # repeat templated records, and the sub-batch
+                    # sharding would otherwise re-embed duplicates
+                    # landing in different shards
+                    unique: Dict[str, int] = {}
+                    positions: List[int] = []
+                    for text in texts:
+                        positions.append(unique.setdefault(text, len(unique)))
+
+                    unique_embeddings = await self._embed_texts_concurrently(
+                        list(unique),
+                        batch_size=min(batch_size, 20),  # Limit embedding batch size
+                        max_in_flight=max_in_flight,
+                    )
+                    # Unit-length rows let the store score with bare
+                    # inner products; a no-op for providers that
+                    # already normalize
+                    _l2_normalize(unique_embeddings)
+                    # Replicate unique rows back to every original position
+                    await embedded_q.put(
+                        (records, unique_embeddings[np.asarray(positions)])
+                    )
+            except BaseException:
+                # Drain upstream so the producer is never stuck on a
+                # full queue while the failure propagates
+                while await processed_q.get() is not None:
+                    pass
+                raise
+            finally:
+                await embedded_q.put(None)
+
+        process_task = asyncio.create_task(process_stage())
+        embed_task = asyncio.create_task(embed_stage())
+
+        # Bounds concurrent vector store writes during failure fan-out
+        write_semaphore = asyncio.Semaphore(max(1, max_in_flight))
+
+        try:
+            # Upsert stage: write each embedded group while the next one
+            # is still being processed and embedded
+            while (item := await embedded_q.get()) is not None:
+                records, embeddings = item
+                written = await self._add_batch_with_fallback(
+                    records, embeddings, write_semaphore
+                )
+                indexed_count += written
+                failed_count += len(records) - written
+
+            # Surface any stage failure hidden behind the sentinels
+            await asyncio.gather(process_task, embed_task)
+
+            if indexed_count == 0:
+                if failed_count == 0:
+                    logger.warning("No valid solutions to index")
+                return {"indexed": 0, "failed": failed_count, "skipped": skipped_count}
+
+            duration = time.perf_counter() - start_time
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Batch indexing completed", extra={
+                    "total_solutions": len(solutions),
+                    "indexed": indexed_count,
+                    "failed": failed_count,
+                    "skipped": skipped_count,
+                    "duration_seconds": duration,
+                })
             
             return {
                 "indexed": indexed_count,
@@ -209,6 +387,9 @@ class IndexingService:
             }
             
         except Exception as e:
+            for task in (process_task, embed_task):
+                task.cancel()
+            await asyncio.gather(process_task, embed_task, return_exceptions=True)
             logger.error(f"Error in batch indexing: {str(e)}")
             return {
                 "indexed": indexed_count,
@@ -217,6 +398,132 @@ class IndexingService:
                 "error": str(e),
             }
     
+    async def _add_batch_with_fallback(
+        self,
+        records: List[SolutionRecord],
+        embeddings: np.ndarray,
+        semaphore: asyncio.Semaphore
+    ) -> int:
+        """
+        Write a batch to the vector store, bisecting on failure.
+
+        One poisoned record used to fail its whole batch. On error the
+        batch splits in half and both halves retry concurrently (bounded
+        by the semaphore), recursing down to single records so only the
+        genuinely unwritable ones are lost.
+
+        Returns:
+            Number of records actually written
+        """
+        try:
+            async with semaphore:
+                await vector_store_service.add_solutions_batch(records, embeddings)
+            return len(records)
+        except Exception as e:
+            if len(records) == 1:
+                return 1 if await self._index_one_with_embedding(records[0], embeddings[0]) else 0
+
+            logger.warning(
+                f"Vector store write failed for {len(records)} records, bisecting: {str(e)}"
+            )
+            mid = len(records) // 2
+            halves = await asyncio.gather(
+                self._add_batch_with_fallback(records[:mid], embeddings[:mid], semaphore),
+                self._add_batch_with_fallback(records[mid:], embeddings[mid:], semaphore),
+            )
+            return sum(halves)
+
+    async def _index_one_with_embedding(
+        self,
+        solution: SolutionRecord,
+        embedding: np.ndarray
+    ) -> bool:
+        """Write a single already-embedded solution, logging on failure."""
+        try:
+            await vector_store_service.add_solution(solution, embedding)
+            return True
+        except Exception as e:
+            logger.error(f"Dropping unwritable solution '{solution.title}': {str(e)}", extra={
+                "solution_id": solution.id,
+                "error_type": type(e).__name__,
+            })
+            return False
+
+    async def _embed_texts_concurrently(
+        self,
+        texts: List[str],
+        batch_size: int,
+        max_in_flight: int = 5
+    ) -> np.ndarray:
+        """
+        Embed texts as concurrent sub-batches, preserving input order.
+
+        Large ingests are dominated by embedding round trips, so the
+        sub-batches overlap under a bounded semaphore instead of running
+        one at a time. A failed sub-batch is retried once on its own
+        before failing the whole ingest.
+
+        Texts are length-sorted before sharding so each sub-batch holds
+        similarly sized texts: a local transformer then pads each batch
+        only to its own longest member instead of a mixed batch's worst
+        case (a no-op for API embedders, which do not charge for
+        padding). Results are scattered back to the input order.
+
+        Args:
+            texts: Texts to embed, in index order
+            batch_size: Number of texts per sub-batch
+            max_in_flight: Maximum sub-batches in flight at once
+
+        Returns:
+            Contiguous float32 matrix of shape (len(texts), dim), one row
+            per text in input order
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        sorted_texts = [texts[i] for i in order]
+
+        semaphore = asyncio.Semaphore(max_in_flight)
+        chunks = [
+            sorted_texts[i:i + batch_size]
+            for i in range(0, len(sorted_texts), batch_size)
+        ]
+
+        async def run_chunk(chunk: List[str]) -> List[Any]:
+            async with semaphore:
+                return await embedding_service.get_embeddings_batch(
+                    chunk, batch_size=batch_size
+                )
+
+        results = await asyncio.gather(
+            *(run_chunk(chunk) for chunk in chunks),
+            return_exceptions=True,
+        )
+
+        # One contiguous float32 buffer for the whole ingest, filled
+        # sub-batch by sub-batch; no per-element Python float boxing
+        sorted_matrix: Optional[np.ndarray] = None
+        offset = 0
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Embedding sub-batch failed, retrying once: {str(result)}")
+                result = await embedding_service.get_embeddings_batch(
+                    chunk, batch_size=batch_size
+                )
+            if sorted_matrix is None:
+                dim = len(result[0])
+                sorted_matrix = np.empty((len(texts), dim), dtype=np.float32)
+            sorted_matrix[offset:offset + len(chunk)] = result
+            offset += len(chunk)
+
+        # Undo the length sort: row for sorted position p belongs at
+        # original index order[p]
+        embeddings = np.empty_like(sorted_matrix)
+        embeddings[np.asarray(order)] = sorted_matrix
+
+        return embeddings
+
     async def update_solution_index(self, solution: SolutionRecord) -> bool:
         """
         Update an existing solution in the index.
@@ -227,24 +534,48 @@ class IndexingService:
         Returns:
             True if successful, False otherwise
         """
-        if not self._initialized:
+        if not self._ready.is_set():
             await self.initialize()
         
         try:
-            # Process the solution content
-            processed_content = await text_processing_service.process_solution_content(
-                solution.content, 
-                solution.title
+            # Fetch the stored record while the content is processed;
+            # metadata-only edits then skip the embedding entirely
+            processed_content, existing = await asyncio.gather(
+                text_processing_service.process_solution_content(
+                    solution.content,
+                    solution.title
+                ),
+                vector_store_service.get_solution_by_id(solution.id),
             )
-            
+
+            if (
+                existing is not None
+                and existing.title == solution.title
+                and existing.content == processed_content
+            ):
+                # Same indexed text, same vector: update tags, url,
+                # category, and timestamp in place
+                await vector_store_service.update_solution_metadata(
+                    existing.model_copy(update={
+                        "category": solution.category,
+                        "updated_at": solution.updated_at,
+                        "tags": solution.tags,
+                        "url": solution.url,
+                    })
+                )
+                logger.info(f"Updated solution metadata only: {solution.title}", extra={
+                    "solution_id": solution.id,
+                })
+                return True
+
             # Validate content quality
             validation = await text_processing_service.validate_content(processed_content)
             if not validation["is_valid"]:
                 logger.warning(f"Updated solution content failed validation: {solution.title}")
                 return False
-            
+
             # Create text for embedding
-            embedding_text = f"{solution.title}\n\n{processed_content}"
+            embedding_text = _make_embed_text(solution.title, processed_content)
             
             # Generate new embedding
             embedding = await embedding_service.get_embedding(embedding_text)
@@ -280,7 +611,7 @@ class IndexingService:
         Returns:
             True if successful, False otherwise
         """
-        if not self._initialized:
+        if not self._ready.is_set():
             await self.initialize()
         
         try:
@@ -311,16 +642,31 @@ class IndexingService:
         Returns:
             List of source documents with similarity scores
         """
-        if not self._initialized:
+        if not self._ready.is_set():
             await self.initialize()
         
         if not query.strip():
             return []
         
         try:
-            # Generate embedding for the query
-            query_embedding = await embedding_service.get_embedding(query.strip())
-            
+            # Reuse the vector for repeated queries; normalization folds
+            # case so UI re-renders and autocomplete variants hit
+            cache_key = query.strip().lower()
+            async with self._query_cache_lock:
+                query_embedding = self._query_cache.get(cache_key)
+                if query_embedding is not None:
+                    self._query_cache.move_to_end(cache_key)
+                    self._query_cache_hits += 1
+
+            if query_embedding is None:
+                query_embedding = await embedding_service.get_embedding(query.strip())
+                async with self._query_cache_lock:
+                    self._query_cache_misses += 1
+                    self._query_cache[cache_key] = query_embedding
+                    self._query_cache.move_to_end(cache_key)
+                    while len(self._query_cache) > self._QUERY_CACHE_MAX:
+                        self._query_cache.popitem(last=False)
+
             # Search vector store
             results = await vector_store_service.search_similar(
                 query_embedding=query_embedding,
@@ -329,12 +675,15 @@ class IndexingService:
                 min_score=min_score
             )
             
-            logger.info(f"Search completed", extra={
-                "query": query[:100] + "..." if len(query) > 100 else query,
-                "results_count": len(results),
-                "top_k": top_k,
-                "category_filter": category_filter,
-            })
+            # Skip the dict and query-slice allocations when filtered;
+            # per-call cost matters on the search hot path
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Search completed", extra={
+                    "query": query[:100] + "..." if len(query) > 100 else query,
+                    "results_count": len(results),
+                    "top_k": top_k,
+                    "category_filter": category_filter,
+                })
             
             return results
             
@@ -342,6 +691,98 @@ class IndexingService:
             logger.error(f"Error searching solutions: {str(e)}")
             raise VectorStoreError(f"Solution search failed: {str(e)}")
     
+    async def search_solutions_batch(
+        self,
+        queries: List[str],
+        top_k: int = 4,
+        category_filter: Optional[str] = None,
+        min_score: float = 0.0
+    ) -> List[List[SourceDoc]]:
+        """
+        Search for solutions for multiple queries at once.
+
+        All queries share one batched embedding call and one vector store
+        RPC, so N queries cost roughly one query's wall-clock time instead
+        of N round trips.
+
+        Args:
+            queries: Search query texts
+            top_k: Number of results to return per query
+            category_filter: Optional category filter
+            min_score: Minimum similarity score threshold
+
+        Returns:
+            One result list per query, aligned to the input order
+            (blank queries yield an empty list)
+        """
+        if not self._ready.is_set():
+            await self.initialize()
+
+        # Keep blank queries in the output shape but skip embedding them
+        stripped = [query.strip() for query in queries]
+        valid_indices = [i for i, query in enumerate(stripped) if query]
+        if not valid_indices:
+            return [[] for _ in queries]
+
+        try:
+            embeddings = await embedding_service.get_embeddings_batch(
+                [stripped[i] for i in valid_indices],
+                batch_size=20,
+            )
+
+            batch_results = await vector_store_service.search_similar_batch(
+                query_embeddings=embeddings,
+                top_k=top_k,
+                category_filter=category_filter,
+                min_score=min_score,
+            )
+
+            results: List[List[SourceDoc]] = [[] for _ in queries]
+            for index, result in zip(valid_indices, batch_results):
+                results[index] = result
+
+            logger.info(f"Batch search completed", extra={
+                "query_count": len(queries),
+                "top_k": top_k,
+                "category_filter": category_filter,
+            })
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Error in batch solution search: {str(e)}")
+            raise VectorStoreError(f"Batch solution search failed: {str(e)}")
+
+    async def list_solutions(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        category_filter: Optional[str] = None
+    ) -> List[SolutionRecord]:
+        """
+        List indexed solutions with pagination.
+
+        Args:
+            limit: Maximum number of solutions to return
+            offset: Number of solutions to skip
+            category_filter: Optional category filter
+
+        Returns:
+            List of solution records
+        """
+        if not self._ready.is_set():
+            await self.initialize()
+
+        try:
+            return await vector_store_service.list_solutions(
+                limit=limit,
+                offset=offset,
+                category_filter=category_filter,
+            )
+        except Exception as e:
+            logger.error(f"Error listing solutions: {str(e)}")
+            raise VectorStoreError(f"Solution listing failed: {str(e)}")
+
     async def get_solution_by_id(self, solution_id: str) -> Optional[SolutionRecord]:
         """
         Get a solution by its ID.
@@ -352,7 +793,7 @@ class IndexingService:
         Returns:
             Solution record if found, None otherwise
         """
-        if not self._initialized:
+        if not self._ready.is_set():
             await self.initialize()
         
         try:
@@ -371,17 +812,25 @@ class IndexingService:
         try:
             stats = {}
             
-            if self._initialized:
+            if self._ready.is_set():
                 # Get vector store stats
                 vector_stats = await vector_store_service.get_collection_stats()
                 
                 # Get embedding service info
                 embedding_info = await embedding_service.get_service_info()
                 
+                lookups = self._query_cache_hits + self._query_cache_misses
                 stats = {
                     "initialized": True,
                     "vector_store": vector_stats,
                     "embedding_service": embedding_info,
+                    "query_cache": {
+                        "size": len(self._query_cache),
+                        "max_size": self._QUERY_CACHE_MAX,
+                        "hits": self._query_cache_hits,
+                        "misses": self._query_cache_misses,
+                        "hit_rate": self._query_cache_hits / lookups if lookups else 0.0,
+                    },
                 }
             else:
                 stats = {
@@ -394,35 +843,50 @@ class IndexingService:
         except Exception as e:
             logger.error(f"Error getting index stats: {str(e)}")
             return {
-                "initialized": self._initialized,
+                "initialized": self._ready.is_set(),
                 "error": str(e)
             }
     
-    async def rebuild_index(self, solutions: List[SolutionRecord]) -> Dict[str, Any]:
+    async def rebuild_index(
+        self,
+        solutions: List[SolutionRecord],
+        bulk: bool = True
+    ) -> Dict[str, Any]:
         """
         Rebuild the entire index with provided solutions.
-        
+
+        With bulk=True (the default) the whole set is processed and
+        embedded, then landed in the vector store with one bulk_insert
+        call — fastest for cold loads, at the cost of holding every
+        embedding in memory at once. bulk=False falls back to the
+        streaming batch pipeline with its bounded memory and per-group
+        writes.
+
         Args:
             solutions: List of all solutions to index
-            
+            bulk: Land everything in a single vector store call
+
         Returns:
             Dictionary with rebuild results
         """
-        if not self._initialized:
+        if not self._ready.is_set():
             await self.initialize()
-        
+
         logger.info(f"Starting index rebuild with {len(solutions)} solutions")
-        
+
         try:
             # Clear existing index (if needed)
             # Note: Chroma doesn't have a clear method, so we'll just add/update
-            
-            # Index all solutions in batch
-            result = await self.index_solutions_batch(solutions)
-            
+
+            if bulk:
+                result = await self._rebuild_bulk(solutions)
+            else:
+                # Index all solutions in batch
+                result = await self.index_solutions_batch(solutions)
+
             logger.info(f"Index rebuild completed", extra=result)
             return result
-            
+
         except Exception as e:
             logger.error(f"Error rebuilding index: {str(e)}")
             return {
@@ -430,6 +894,81 @@ class IndexingService:
                 "failed": len(solutions),
                 "error": str(e)
             }
+
+    async def _rebuild_bulk(
+        self,
+        solutions: List[SolutionRecord],
+        batch_size: int = 10,
+        max_in_flight: int = 5
+    ) -> Dict[str, Any]:
+        """
+        Process, embed, and bulk-insert a full record set.
+
+        Processing still runs in bounded groups and embedding in
+        concurrent sub-batches, but every vector lands in one
+        pre-allocated matrix handed to the store in a single call.
+        """
+        start_time = time.perf_counter()
+        skipped_count = 0
+
+        valid_solutions: List[SolutionRecord] = []
+        embedding_texts: List[str] = []
+
+        group_size = batch_size * max(1, max_in_flight)
+        for start in range(0, len(solutions), group_size):
+            group = []
+            for candidate in solutions[start:start + group_size]:
+                reject_reason = _quick_reject(candidate)
+                if reject_reason is None:
+                    group.append(candidate)
+                else:
+                    skipped_count += 1
+            if not group:
+                continue
+
+            pairs = await text_processing_service.batch_process_solutions_records(
+                group,
+                batch_size=batch_size
+            )
+            for original, processed in pairs:
+                validation = processed.get("content_validation", {})
+                if validation.get("is_valid", True):
+                    record = original.model_copy(
+                        update={"content": processed["processed_content"]}
+                    )
+                    valid_solutions.append(record)
+                    embedding_texts.append(_make_embed_text(record.title, record.content))
+                else:
+                    skipped_count += 1
+
+        if not valid_solutions:
+            logger.warning("No valid solutions to rebuild index with")
+            return {"indexed": 0, "failed": 0, "skipped": skipped_count}
+
+        # Embed each distinct text once across the entire rebuild
+        unique: Dict[str, int] = {}
+        positions: List[int] = []
+        for text in embedding_texts:
+            positions.append(unique.setdefault(text, len(unique)))
+
+        unique_embeddings = await self._embed_texts_concurrently(
+            list(unique),
+            batch_size=min(batch_size, 20),
+            max_in_flight=max_in_flight,
+        )
+        _l2_normalize(unique_embeddings)
+        embeddings = unique_embeddings[np.asarray(positions)]
+
+        # One round trip lands the whole rebuild
+        await vector_store_service.bulk_insert(valid_solutions, embeddings)
+
+        duration = time.perf_counter() - start_time
+        return {
+            "indexed": len(valid_solutions),
+            "failed": 0,
+            "skipped": skipped_count,
+            "duration_seconds": duration,
+        }
     
     async def health_check(self) -> Dict[str, Any]:
         """
@@ -439,7 +978,7 @@ class IndexingService:
             Dictionary with health status
         """
         try:
-            if not self._initialized:
+            if not self._ready.is_set():
                 return {
                     "healthy": False,
                     "error": "Service not initialized"
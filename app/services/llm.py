@@ -2,23 +2,164 @@
 
 import asyncio
 import json
+import time
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, AsyncGenerator
 from enum import Enum
 
 import httpx
 import ollama
-from openai import AsyncOpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
 from app.core.exceptions import LLMError
 from app.core.logging import get_logger
 from app.models.schemas import SourceDoc
+from app.services.llm_cache import llm_cache
 
 logger = get_logger(__name__)
 
 
+# Shared by both providers; built once so every request reuses the same
+# string object, which also keeps the prompt prefix byte-identical
+# across requests for providers that cache prompt prefixes
+_SYSTEM_PROMPT = """You are an AI assistant helping IT staff resolve user issues using SolarWinds knowledge base solutions.
+
+Your role:
+- Help IT staff find solutions to resolve user problems
+- Provide step-by-step guidance for IT staff to assist users
+- Reference relevant SolarWinds documentation when available
+- Focus on practical resolution steps for IT professionals
+
+Guidelines:
+- Frame responses for IT staff, not end users
+- Include troubleshooting steps IT staff can follow
+- Mention when issues might need escalation
+- Keep responses professional and concise
+- Always cite sources when using SolarWinds documentation"""
+
+
+# Constant tail of the no-sources prompt, shared by both providers
+_NO_SOURCES_TAIL = "\n\nNo specific SolarWinds documentation found for this query. Please provide general IT guidance for this issue."
+
+
+# Status codes worth retrying: rate limits and transient server errors
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether a generation failure is worth retrying.
+
+    Auth failures, malformed requests, and content rejections fail the
+    same way on every attempt; retrying them only adds seconds of user
+    latency and burns tokens. Providers raise LLMError wrapping the
+    original cause, so the predicate unwraps before classifying.
+    """
+    if isinstance(exc, LLMError) and exc.__cause__ is not None:
+        exc = exc.__cause__
+    if isinstance(exc, (httpx.ConnectError, httpx.ReadTimeout, APIConnectionError)):
+        return True
+    if isinstance(exc, APIStatusError):
+        return exc.status_code in _RETRYABLE_STATUS
+    # ollama.ResponseError carries a bare status_code attribute
+    return getattr(exc, "status_code", None) in _RETRYABLE_STATUS
+
+
+_encoder = None
+_encoder_failed = False
+
+
+def _get_encoder():
+    """Load the tiktoken encoder once, tolerating offline environments."""
+    global _encoder, _encoder_failed
+    if _encoder is None and not _encoder_failed:
+        try:
+            import tiktoken
+            _encoder = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            logger.warning(f"tiktoken unavailable, trimming sources by characters: {str(e)}")
+            _encoder_failed = True
+    return _encoder
+
+
+def _trim_content(content: str, max_tokens: int) -> str:
+    """Cap source content at a token budget before it enters the prompt.
+
+    Full KB articles can run to kilobytes per source; capping each one
+    bounds prompt size (and with it per-token cost and time to first
+    token) while keeping the opening steps, which carry most of the
+    resolution value. Falls back to a ~4 chars/token heuristic when the
+    tokenizer cannot load.
+    """
+    encoder = _get_encoder()
+    if encoder is None:
+        limit = max_tokens * 4
+        return content if len(content) <= limit else content[:limit]
+    ids = encoder.encode(content)
+    if len(ids) <= max_tokens:
+        return content
+    return encoder.decode(ids[:max_tokens])
+
+
+@lru_cache(maxsize=4096)
+def _fmt_source(source_id: str, title: str, content: str, max_tokens: int) -> str:
+    """Render one source, memoized on its fields.
+
+    Top-K retrieval serves the same handful of solutions across many
+    queries, so the per-source formatting and token-budget trimming
+    (which scale with content length) are paid once per distinct
+    solution instead of per request.
+    """
+    if max_tokens > 0:
+        content = _trim_content(content, max_tokens)
+    return f"(ID: {source_id}): {title}\n{content}"
+
+
+def _format_sources_block(sources: List[SourceDoc]) -> str:
+    """Render retrieved sources as a deterministic documentation block.
+
+    Sources are stable-sorted by id so two queries hitting the same
+    solution set produce an identical block regardless of retrieval
+    order, keeping the cacheable prefix stable.
+    """
+    ordered = sorted(sources, key=lambda source: source.id)
+    sources_text = "\n\n".join([
+        f"Source {i+1} {_fmt_source(source.id, source.title, getattr(source, 'content', None) or 'No content available', settings.source_token_budget)}"
+        for i, source in enumerate(ordered)
+    ])
+    return f"Relevant SolarWinds Documentation:\n{sources_text}"
+
+
+async def _buffered(chunks: AsyncGenerator[str, None]) -> AsyncGenerator[str, None]:
+    """Re-yield a token stream through a bounded queue.
+
+    Yielding straight from the provider loop couples network receive
+    rate to downstream SSE framing and socket writes. A producer task
+    keeps reading from the provider while the consumer is busy sending,
+    so slow clients no longer stall TCP reads; the bound caps buffered
+    tokens when the client is slower than generation.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+
+    async def produce() -> None:
+        try:
+            async for chunk in chunks:
+                await queue.put(chunk)
+        finally:
+            await queue.put(None)
+
+    task = asyncio.create_task(produce())
+    try:
+        while (chunk := await queue.get()) is not None:
+            yield chunk
+        await task  # Surface provider errors to the consumer
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
 class LLMProvider(str, Enum):
     """Available LLM providers."""
     OPENROUTER = "openrouter"
@@ -58,20 +199,46 @@ class OpenRouterProvider(BaseLLMProvider):
     
     def __init__(self):
         self.client: Optional[AsyncOpenAI] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self._init_lock = asyncio.Lock()
         self.model = settings.openrouter_model
-        
+
     async def initialize(self) -> None:
         """Initialize the OpenRouter client."""
-        if not settings.openrouter_api_key:
-            raise LLMError("OpenRouter API key not configured")
-            
-        self.client = AsyncOpenAI(
-            api_key=settings.openrouter_api_key,
-            base_url="https://openrouter.ai/api/v1"
-        )
-        logger.info(f"OpenRouter provider initialized with model: {self.model}")
+        async with self._init_lock:
+            if self.client is not None:
+                return  # Another coroutine won the race
+
+            if not settings.openrouter_api_key:
+                raise LLMError("OpenRouter API key not configured")
+
+            # Warm the resolver so the first generation doesn't pay DNS
+            # latency on top of the TLS handshake
+            try:
+                await asyncio.get_running_loop().getaddrinfo("openrouter.ai", 443)
+            except OSError:
+                pass  # Offline or DNS failure surfaces on the actual call
+
+            # Shared HTTP/2 pool: streams multiplex over one connection and
+            # the keepalive pool skips TCP+TLS setup on subsequent calls
+            self._http = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+            )
+            self.client = AsyncOpenAI(
+                api_key=settings.openrouter_api_key,
+                base_url="https://openrouter.ai/api/v1",
+                http_client=self._http,
+            )
+            logger.info(f"OpenRouter provider initialized with model: {self.model}")
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    @retry(
+        retry=retry_if_exception(_is_transient),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.5, min=1, max=5),
+        reraise=True,
+    )
     async def generate_response(
         self, 
         prompt: str, 
@@ -83,11 +250,26 @@ class OpenRouterProvider(BaseLLMProvider):
             await self.initialize()
         
         try:
+            system_prompt = self._create_system_prompt()
+            user_prompt = self._format_prompt_with_sources(prompt, sources)
             messages = [
-                {"role": "system", "content": self._create_system_prompt()},
-                {"role": "user", "content": self._format_prompt_with_sources(prompt, sources)}
+                {"role": "system", "content": system_prompt},
+                self._user_message(prompt, sources)
             ]
-            
+
+            # Identical prompt + model + temperature means identical
+            # request; serve the finished completion instead of paying
+            # for generation again. Streams are never cached
+            cache_key = None
+            if not stream and settings.llm_cache_ttl_seconds > 0:
+                cache_key = llm_cache.make_key(
+                    "openrouter", self.model, system_prompt, user_prompt, 0.7
+                )
+                cached = await llm_cache.get(cache_key)
+                if cached is not None:
+                    logger.info("Serving LLM response from exact-match cache")
+                    return cached
+
             response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
@@ -95,15 +277,18 @@ class OpenRouterProvider(BaseLLMProvider):
                 max_tokens=1500,
                 stream=stream
             )
-            
+
             if stream:
                 return response  # Return the stream object for streaming responses
-            else:
-                return response.choices[0].message.content
-                
+
+            content = response.choices[0].message.content
+            if cache_key is not None:
+                await llm_cache.set(cache_key, content, settings.llm_cache_ttl_seconds)
+            return content
+
         except Exception as e:
             logger.error(f"OpenRouter error: {str(e)}")
-            raise LLMError(f"OpenRouter generation failed: {str(e)}")
+            raise LLMError(f"OpenRouter generation failed: {str(e)}") from e
     
     async def generate_response_stream(
         self, 
@@ -117,9 +302,9 @@ class OpenRouterProvider(BaseLLMProvider):
         try:
             messages = [
                 {"role": "system", "content": self._create_system_prompt()},
-                {"role": "user", "content": self._format_prompt_with_sources(prompt, sources)}
+                self._user_message(prompt, sources)
             ]
-            
+
             stream = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
@@ -127,14 +312,18 @@ class OpenRouterProvider(BaseLLMProvider):
                 max_tokens=1500,
                 stream=True
             )
-            
-            async for chunk in stream:
-                if chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
-                    
+
+            async def produce() -> AsyncGenerator[str, None]:
+                async for chunk in stream:
+                    if chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+
+            async for content in _buffered(produce()):
+                yield content
+
         except Exception as e:
             logger.error(f"OpenRouter streaming error: {str(e)}")
-            raise LLMError(f"OpenRouter streaming failed: {str(e)}")
+            raise LLMError(f"OpenRouter streaming failed: {str(e)}") from e
     
     async def health_check(self) -> bool:
         """Check OpenRouter availability."""
@@ -142,50 +331,64 @@ class OpenRouterProvider(BaseLLMProvider):
             if not self.client:
                 await self.initialize()
             
-            # Simple test call
+            # Minimal liveness probe: one user token, no system prompt,
+            # deterministic so provider-side caches can serve it
             response = await self.client.chat.completions.create(
                 model=self.model,
-                messages=[{"role": "user", "content": "test"}],
-                max_tokens=1
+                messages=[{"role": "user", "content": "ping"}],
+                max_tokens=1,
+                temperature=0
             )
             return True
         except Exception as e:
             logger.warning(f"OpenRouter health check failed: {str(e)}")
             return False
     
-    def _create_system_prompt(self) -> str:
-        """Create the system prompt for IT staff assistance."""
-        return """You are an AI assistant helping IT staff resolve user issues using SolarWinds knowledge base solutions.
+    def _user_message(self, prompt: str, sources: List[SourceDoc]) -> Dict[str, Any]:
+        """Build the user message, marking the sources block cacheable.
 
-Your role:
-- Help IT staff find solutions to resolve user problems
-- Provide step-by-step guidance for IT staff to assist users
-- Reference relevant SolarWinds documentation when available
-- Focus on practical resolution steps for IT professionals
+        With sources present the content uses the block-list form so the
+        leading documentation block carries cache_control; providers
+        that support prompt caching reuse it across queries sharing a
+        source set, and the rest ignore the annotation.
+        """
+        if not sources:
+            return {"role": "user", "content": self._format_prompt_with_sources(prompt, sources)}
 
-Guidelines:
-- Frame responses for IT staff, not end users
-- Include troubleshooting steps IT staff can follow
-- Mention when issues might need escalation
-- Keep responses professional and concise
-- Always cite sources when using SolarWinds documentation"""
+        return {
+            "role": "user",
+            "content": [
+                {
+                    "type": "text",
+                    "text": _format_sources_block(sources),
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {
+                    "type": "text",
+                    "text": f"""Query: {prompt}
+
+Based on the above documentation, provide IT staff guidance for resolving this issue.""",
+                },
+            ],
+        }
+
+    def _create_system_prompt(self) -> str:
+        """Return the shared system prompt for IT staff assistance."""
+        return _SYSTEM_PROMPT
     
     def _format_prompt_with_sources(self, prompt: str, sources: List[SourceDoc]) -> str:
-        """Format the user prompt with relevant sources."""
+        """Format the user prompt with relevant sources.
+
+        The sources block leads and the query trails so requests sharing
+        a source set share their longest prefix byte for byte — the
+        shape provider-side prompt caching keys on.
+        """
         if not sources:
-            return f"""Query: {prompt}
+            return f"Query: {prompt}{_NO_SOURCES_TAIL}"
 
-No specific SolarWinds documentation found for this query. Please provide general IT guidance for this issue."""
-        
-        sources_text = "\n\n".join([
-            f"Source {i+1} (ID: {source.id}): {source.title}\n{getattr(source, 'content', 'No content available')}"
-            for i, source in enumerate(sources)
-        ])
-        
-        return f"""Query: {prompt}
+        return f"""{_format_sources_block(sources)}
 
-Relevant SolarWinds Documentation:
-{sources_text}
+Query: {prompt}
 
 Based on the above documentation, provide IT staff guidance for resolving this issue."""
 
@@ -195,110 +398,127 @@ class OLLAMAProvider(BaseLLMProvider):
     
     def __init__(self):
         self.client = None
+        self._init_lock = asyncio.Lock()
         self.model = settings.ollama_model
         self.base_url = settings.ollama_base_url
-        
+
     async def initialize(self) -> None:
         """Initialize the OLLAMA client."""
-        try:
-            # OLLAMA client is synchronous, so we'll use it in a thread pool
-            self.client = ollama.Client(host=self.base_url)
-            
-            # Check if model is available
-            models = await asyncio.get_event_loop().run_in_executor(
-                None, self.client.list
-            )
-            
-            model_names = [m['name'] for m in models.get('models', [])]
-            if self.model not in model_names:
-                logger.warning(f"Model {self.model} not found. Available: {model_names}")
-                # Try to pull the model
-                await asyncio.get_event_loop().run_in_executor(
-                    None, self.client.pull, self.model
-                )
-            
-            logger.info(f"OLLAMA provider initialized with model: {self.model}")
-            
-        except Exception as e:
-            raise LLMError(f"OLLAMA initialization failed: {str(e)}")
-    
+        async with self._init_lock:
+            if self.client is not None:
+                return  # Another coroutine won the race
+
+            try:
+                # Use the async client so concurrent chats share the event loop
+                # instead of each tying up a threadpool worker
+                client = ollama.AsyncClient(host=self.base_url)
+
+                # Check if model is available
+                models = await client.list()
+
+                model_names = [m['name'] for m in models.get('models', [])]
+                if self.model not in model_names:
+                    logger.warning(f"Model {self.model} not found. Available: {model_names}")
+                    # Try to pull the model
+                    await client.pull(self.model)
+
+                self.client = client
+                logger.info(f"OLLAMA provider initialized with model: {self.model}")
+
+            except Exception as e:
+                raise LLMError(f"OLLAMA initialization failed: {str(e)}")
+
+    @retry(
+        retry=retry_if_exception(_is_transient),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.5, min=1, max=5),
+        reraise=True,
+    )
     async def generate_response(
-        self, 
-        prompt: str, 
+        self,
+        prompt: str,
         sources: List[SourceDoc],
         stream: bool = False
     ) -> str:
         """Generate a response using OLLAMA."""
         if not self.client:
             await self.initialize()
-        
+
         try:
             formatted_prompt = self._format_prompt_with_sources(prompt, sources)
-            
-            # Run OLLAMA in thread pool since it's synchronous
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.generate(
-                    model=self.model,
-                    prompt=formatted_prompt,
-                    stream=stream
+
+            # The system prompt is baked into formatted_prompt here, so
+            # the key's system slot stays empty; OLLAMA runs at its
+            # model-default temperature
+            cache_key = None
+            if not stream and settings.llm_cache_ttl_seconds > 0:
+                cache_key = llm_cache.make_key(
+                    "ollama", self.model, "", formatted_prompt, 0.0
                 )
+                cached = await llm_cache.get(cache_key)
+                if cached is not None:
+                    logger.info("Serving LLM response from exact-match cache")
+                    return cached
+
+            response = await self.client.generate(
+                model=self.model,
+                prompt=formatted_prompt,
+                stream=stream
             )
-            
+
             if stream:
-                return response  # Return generator for streaming
-            else:
-                return response.get('response', '')
-                
+                return response  # Return async iterator for streaming
+
+            content = response.get('response', '')
+            if cache_key is not None:
+                await llm_cache.set(cache_key, content, settings.llm_cache_ttl_seconds)
+            return content
+
         except Exception as e:
             logger.error(f"OLLAMA error: {str(e)}")
-            raise LLMError(f"OLLAMA generation failed: {str(e)}")
-    
+            raise LLMError(f"OLLAMA generation failed: {str(e)}") from e
+
     async def generate_response_stream(
-        self, 
-        prompt: str, 
+        self,
+        prompt: str,
         sources: List[SourceDoc]
     ) -> AsyncGenerator[str, None]:
         """Generate a streaming response using OLLAMA."""
         if not self.client:
             await self.initialize()
-        
+
         try:
             formatted_prompt = self._format_prompt_with_sources(prompt, sources)
-            
-            # OLLAMA streaming is more complex with async execution
-            def generate_stream():
-                return self.client.generate(
-                    model=self.model,
-                    prompt=formatted_prompt,
-                    stream=True
-                )
-            
-            # Run in thread pool and yield chunks
-            stream = await asyncio.get_event_loop().run_in_executor(None, generate_stream)
-            
-            for chunk in stream:
-                if chunk.get('response'):
-                    yield chunk['response']
-                    
+
+            stream = await self.client.generate(
+                model=self.model,
+                prompt=formatted_prompt,
+                stream=True
+            )
+
+            async def produce() -> AsyncGenerator[str, None]:
+                async for chunk in stream:
+                    if chunk.get('response'):
+                        yield chunk['response']
+
+            async for content in _buffered(produce()):
+                yield content
+
         except Exception as e:
             logger.error(f"OLLAMA streaming error: {str(e)}")
-            raise LLMError(f"OLLAMA streaming failed: {str(e)}")
-    
+            raise LLMError(f"OLLAMA streaming failed: {str(e)}") from e
+
     async def health_check(self) -> bool:
         """Check OLLAMA availability."""
         try:
             if not self.client:
                 await self.initialize()
-            
+
             # Simple test generation
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.generate(
-                    model=self.model,
-                    prompt="test",
-                    options={"num_predict": 1}
-                )
+            await self.client.generate(
+                model=self.model,
+                prompt="test",
+                options={"num_predict": 1}
             )
             return True
         except Exception as e:
@@ -307,76 +527,110 @@ class OLLAMAProvider(BaseLLMProvider):
     
     def _format_prompt_with_sources(self, prompt: str, sources: List[SourceDoc]) -> str:
         """Format the user prompt with relevant sources for OLLAMA."""
-        system_prompt = """You are an AI assistant helping IT staff resolve user issues using SolarWinds knowledge base solutions.
-
-Your role:
-- Help IT staff find solutions to resolve user problems
-- Provide step-by-step guidance for IT staff to assist users
-- Reference relevant SolarWinds documentation when available
-- Focus on practical resolution steps for IT professionals
-
-Guidelines:
-- Frame responses for IT staff, not end users
-- Include troubleshooting steps IT staff can follow
-- Mention when issues might need escalation
-- Keep responses professional and concise
-- Always cite sources when using SolarWinds documentation
-
-"""
-        
         if not sources:
-            return f"""{system_prompt}
+            return f"{_SYSTEM_PROMPT}\n\nQuery: {prompt}{_NO_SOURCES_TAIL}"
 
-Query: {prompt}
+        return f"""{_SYSTEM_PROMPT}
 
-No specific SolarWinds documentation found for this query. Please provide general IT guidance for this issue."""
-        
-        sources_text = "\n\n".join([
-            f"Source {i+1} (ID: {source.id}): {source.title}\n{getattr(source, 'content', 'No content available')}"
-            for i, source in enumerate(sources)
-        ])
-        
-        return f"""{system_prompt}
+{_format_sources_block(sources)}
 
 Query: {prompt}
 
-Relevant SolarWinds Documentation:
-{sources_text}
-
 Based on the above documentation, provide IT staff guidance for resolving this issue."""
 
 
 class LLMService:
     """Main LLM service that manages different providers."""
-    
+
+    # How long after a failure the service reports unhealthy before
+    # allowing another generation attempt
+    FAILURE_BACKOFF_SECONDS = 30.0
+
     def __init__(self):
         self.provider: Optional[BaseLLMProvider] = None
         self.provider_type: Optional[LLMProvider] = None
-        
+        self._init_lock = asyncio.Lock()
+        self._ready = asyncio.Event()
+        self._last_failure_ts: float = 0.0
+
+    @property
+    def is_healthy(self) -> bool:
+        """Whether the last generation/health probe indicated a working LLM."""
+        if self._last_failure_ts == 0.0:
+            return True
+        return time.monotonic() - self._last_failure_ts > self.FAILURE_BACKOFF_SECONDS
+
     async def initialize(self) -> None:
-        """Initialize the LLM service with the configured provider."""
-        provider_name = settings.llm_provider.lower()
-        
-        if provider_name == LLMProvider.OPENROUTER:
-            self.provider = OpenRouterProvider()
-            self.provider_type = LLMProvider.OPENROUTER
-        elif provider_name == LLMProvider.OLLAMA:
-            self.provider = OLLAMAProvider()
-            self.provider_type = LLMProvider.OLLAMA
-        else:
-            raise LLMError(f"Unknown LLM provider: {provider_name}")
-        
-        await self.provider.initialize()
-        logger.info(f"LLM service initialized with provider: {self.provider_type}")
+        """Initialize the LLM service with the configured provider.
+
+        Safe under concurrent first requests: the lock serializes
+        initialization so cold start builds one client (and triggers at
+        most one model pull) instead of one per racing coroutine.
+        """
+        async with self._init_lock:
+            if self._ready.is_set():
+                return
+
+            provider_name = settings.llm_provider.lower()
+
+            if provider_name == LLMProvider.OPENROUTER:
+                self.provider = OpenRouterProvider()
+                self.provider_type = LLMProvider.OPENROUTER
+            elif provider_name == LLMProvider.OLLAMA:
+                self.provider = OLLAMAProvider()
+                self.provider_type = LLMProvider.OLLAMA
+            else:
+                raise LLMError(f"Unknown LLM provider: {provider_name}")
+
+            await self.provider.initialize()
+            self._ready.set()
+            logger.info(f"LLM service initialized with provider: {self.provider_type}")
     
+    async def prepare_prompt_skeleton(self, query: str) -> Dict[str, Any]:
+        """
+        Warm up generation ahead of retrieval.
+
+        Designed to run concurrently with retrieval via asyncio.gather so
+        provider initialization comes off the critical path of the first
+        chat request. The system prompt is a module constant, so the
+        skeleton carries only the query for complete_with_sources.
+
+        Args:
+            query: User query
+
+        Returns:
+            Prompt skeleton to pass to complete_with_sources
+        """
+        if not self._ready.is_set():
+            await self.initialize()
+
+        return {"query": query}
+
+    async def complete_with_sources(
+        self,
+        skeleton: Dict[str, Any],
+        sources: List[SourceDoc]
+    ) -> str:
+        """
+        Complete a previously prepared prompt skeleton with retrieved sources.
+
+        Args:
+            skeleton: Skeleton from prepare_prompt_skeleton
+            sources: Retrieved source documents
+
+        Returns:
+            Generated response
+        """
+        return await self.generate_response(skeleton["query"], sources)
+
     async def generate_response(
-        self, 
-        query: str, 
+        self,
+        query: str,
         sources: List[SourceDoc],
         stream: bool = False
     ) -> str:
         """Generate a response for the given query and sources."""
-        if not self.provider:
+        if not self._ready.is_set():
             await self.initialize()
         
         logger.info(f"Generating LLM response for query with {len(sources)} sources")
@@ -384,9 +638,11 @@ class LLMService:
         try:
             response = await self.provider.generate_response(query, sources, stream)
             logger.info("LLM response generated successfully")
+            self._last_failure_ts = 0.0
             return response
         except Exception as e:
             logger.error(f"LLM response generation failed: {str(e)}")
+            self._last_failure_ts = time.monotonic()
             raise
     
     async def generate_response_stream(
@@ -395,7 +651,7 @@ class LLMService:
         sources: List[SourceDoc]
     ) -> AsyncGenerator[str, None]:
         """Generate a streaming response for the given query and sources."""
-        if not self.provider:
+        if not self._ready.is_set():
             await self.initialize()
         
         logger.info(f"Generating streaming LLM response for query with {len(sources)} sources")
@@ -409,7 +665,7 @@ class LLMService:
     
     async def health_check(self) -> Dict[str, Any]:
         """Check the health of the LLM service."""
-        if not self.provider:
+        if not self._ready.is_set():
             try:
                 await self.initialize()
             except Exception as e:
@@ -421,6 +677,7 @@ class LLMService:
         
         try:
             is_healthy = await self.provider.health_check()
+            self._last_failure_ts = 0.0 if is_healthy else time.monotonic()
             return {
                 "provider": self.provider_type,
                 "status": "healthy" if is_healthy else "unhealthy",
@@ -439,7 +696,11 @@ class LLMService:
             # Close any open connections
             if hasattr(self.provider, 'client') and hasattr(self.provider.client, 'close'):
                 await self.provider.client.close()
-        
+            http = getattr(self.provider, '_http', None)
+            if http is not None:
+                await http.aclose()
+
+        self._ready.clear()
         logger.info("LLM service cleaned up")
 
 
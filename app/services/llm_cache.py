@@ -0,0 +1,43 @@
+"""Exact-match cache for completed LLM generations."""
+
+import hashlib
+
+from app.services.response_cache import ResponseCache
+
+
+class LLMCache(ResponseCache):
+    """
+    TTL cache for finished completions keyed by the full request.
+
+    Generation is the most expensive call in the stack (seconds of
+    network and token time), and repeated deterministic requests — test
+    harnesses, retried UI calls, popular questions against unchanged
+    sources — produce byte-identical prompts. The key digests provider,
+    model, both prompts, and temperature, so any change in sources or
+    configuration misses cleanly. Storage (Redis with in-process
+    fallback) is inherited from ResponseCache under a dedicated prefix.
+
+    Streaming responses are never cached here; they are consumed as
+    they are produced and not materialized.
+    """
+
+    KEY_PREFIX = "sw-llm"
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+    ) -> str:
+        """Digest every input that shapes the completion into one key."""
+        hasher = hashlib.sha256()
+        for part in (provider, model, system_prompt, user_prompt, repr(temperature)):
+            hasher.update(part.encode())
+            hasher.update(b"\x00")
+        return hasher.hexdigest()
+
+
+# Global LLM cache instance
+llm_cache = LLMCache()
@@ -2,7 +2,7 @@
 
 import uuid
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 import random
 
 from app.models.schemas import SolutionRecord
@@ -263,20 +263,36 @@ Advanced Troubleshooting:
     }
 ]
 
+_BASE_COUNT = len(SAMPLE_SOLUTIONS)
+
 
 class MockDataService:
     """Service for generating mock SolarWinds solution data."""
-    
+
     def __init__(self):
         self.solutions_generated = False
-        
+        self._solutions: Optional[List[SolutionRecord]] = None
+
     def generate_mock_solutions(self) -> List[SolutionRecord]:
-        """Generate mock solution records for development."""
+        """Generate mock solution records for development.
+
+        The records are immutable fixtures, so the list is built once
+        and reused; repeated callers (sync jobs, tests, sampling) skip
+        re-running Pydantic construction over the whole set.
+        """
+        if self._solutions is not None:
+            return self._solutions
+
         solutions = []
-        
+
         # Use base solutions and create variations
-        base_count = len(SAMPLE_SOLUTIONS)
+        base_count = _BASE_COUNT
         target_count = settings.mock_solutions_count
+
+        # 31 possible "updated within the last month" stamps, built once
+        # instead of a fresh utcnow/timedelta pair per record
+        now = datetime.utcnow()
+        stamps = [now - timedelta(days=days_ago) for days_ago in range(31)]
         
         for i in range(target_count):
             # Cycle through base solutions and create variations
@@ -291,28 +307,28 @@ class MockDataService:
                 variation = (i // base_count) + 1
                 title = f"{title} (Variation {variation})"
             
-            # Create random updated timestamp within last 30 days
-            days_ago = random.randint(0, 30)
-            updated_at = datetime.utcnow() - timedelta(days=days_ago)
-            
-            # Create solution record
-            solution = SolutionRecord(
+            # All inputs are trusted literals from this module, so skip
+            # Pydantic validation; construction cost dominates this loop
+            # for large mock_solutions_count. Records are treated as
+            # read-only fixtures, so sharing the base tags list is safe.
+            solution = SolutionRecord.model_construct(
                 id=solution_id,
                 title=title,
                 category=base_solution["category"],
                 content=base_solution["content"],
-                updated_at=updated_at,
-                tags=base_solution["tags"].copy(),
+                updated_at=stamps[random.randrange(31)],
+                tags=base_solution["tags"],
                 url=f"https://mock.solarwinds.com/kb/{solution_id}"
             )
-            
+
             solutions.append(solution)
         
         logger.info(f"Generated {len(solutions)} mock solutions for development")
         self.solutions_generated = True
-        
+        self._solutions = solutions
+
         return solutions
-    
+
     def get_random_solutions(self, count: int = 5) -> List[SolutionRecord]:
         """Get a random subset of mock solutions."""
         all_solutions = self.generate_mock_solutions()
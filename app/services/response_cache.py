@@ -0,0 +1,111 @@
+"""Redis-backed response cache for read-heavy API endpoints."""
+
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _json_default(value: Any) -> str:
+    """Serialize datetimes the same way the response layer does (ISO 8601)."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class ResponseCache:
+    """
+    Small TTL cache for endpoint responses.
+
+    Backed by Redis (settings.redis_url) so cached entries are shared
+    across workers; falls back to an in-process dict when Redis is
+    disabled or unreachable, matching the fallback promised in config.
+    Values must be JSON-serializable.
+    """
+
+    KEY_PREFIX = "sw-cache"
+
+    def __init__(self):
+        self._redis: Optional[aioredis.Redis] = None
+        self._redis_failed = False
+        # In-memory fallback: key -> (expiry monotonic ts, value)
+        self._local: Dict[str, tuple] = {}
+
+    def _get_redis(self) -> Optional[aioredis.Redis]:
+        """Lazily create the Redis client, or None if Redis is unavailable."""
+        if not settings.redis_enabled or self._redis_failed:
+            return None
+        if self._redis is None:
+            self._redis = aioredis.from_url(
+                settings.redis_url,
+                db=settings.redis_db,
+                decode_responses=True,
+            )
+        return self._redis
+
+    def _full_key(self, key: str) -> str:
+        return f"{self.KEY_PREFIX}:{key}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None on miss/expiry."""
+        client = self._get_redis()
+        if client is not None:
+            try:
+                raw = await client.get(self._full_key(key))
+                return json.loads(raw) if raw is not None else None
+            except Exception as e:
+                self._mark_redis_failed(e)
+
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expiry, value = entry
+        if time.monotonic() >= expiry:
+            del self._local[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """Cache a JSON-serializable value for ttl_seconds."""
+        client = self._get_redis()
+        if client is not None:
+            try:
+                await client.set(
+                    self._full_key(key),
+                    json.dumps(value, default=_json_default),
+                    ex=int(ttl_seconds),
+                )
+                return
+            except Exception as e:
+                self._mark_redis_failed(e)
+
+        self._local[key] = (time.monotonic() + ttl_seconds, value)
+
+    async def clear(self) -> None:
+        """Drop all cached responses (called after a successful sync)."""
+        self._local.clear()
+        client = self._get_redis()
+        if client is not None:
+            try:
+                keys = [key async for key in client.scan_iter(f"{self.KEY_PREFIX}:*")]
+                if keys:
+                    await client.delete(*keys)
+            except Exception as e:
+                self._mark_redis_failed(e)
+
+    def _mark_redis_failed(self, error: Exception) -> None:
+        """Disable Redis after a failure so requests don't retry it."""
+        if not self._redis_failed:
+            logger.warning(f"Redis response cache unavailable, using in-memory fallback: {str(error)}")
+        self._redis_failed = True
+
+
+# Global response cache instance
+response_cache = ResponseCache()
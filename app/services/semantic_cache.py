@@ -0,0 +1,161 @@
+"""Semantic response cache keyed by query embeddings."""
+
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.schemas import ChatResponse
+
+logger = get_logger(__name__)
+
+
+class SemanticCache:
+    """
+    In-memory cache of chat responses keyed by L2-normalized query embeddings.
+
+    Repeated or near-duplicate IT queries (password reset, printer, VPN)
+    dominate the real workload; a cache hit skips vector search and LLM
+    generation entirely. Lookup is a flat inner-product scan over the cached
+    embedding matrix, which is exact cosine similarity since all vectors are
+    unit length.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        similarity_threshold: float = 0.85,
+        merge_threshold: float = 0.95,
+        ttl_seconds: float = 300.0,
+    ):
+        self.max_size = max_size
+        self.similarity_threshold = similarity_threshold
+        self.merge_threshold = merge_threshold
+        self.ttl_seconds = ttl_seconds
+
+        # (n, d) matrix of unit-length query embeddings; rows parallel entries
+        self._embeddings: Optional[np.ndarray] = None
+        self._entries: List[Dict[str, Any]] = []
+        self._hit_count = 0
+        self._total_requests = 0
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        """Convert an embedding to a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector = vector / norm
+        return vector
+
+    def get(self, query_embedding: List[float]) -> Optional[ChatResponse]:
+        """
+        Look up a cached response for a semantically similar query.
+
+        Args:
+            query_embedding: Embedding of the incoming query
+
+        Returns:
+            Cached ChatResponse if a non-expired entry is similar enough,
+            None otherwise
+        """
+        self._total_requests += 1
+
+        if self._embeddings is None or len(self._entries) == 0:
+            return None
+
+        query_vector = self._normalize(query_embedding)
+        similarities = self._embeddings @ query_vector
+        best_index = int(np.argmax(similarities))
+        best_score = float(similarities[best_index])
+
+        if best_score < self.similarity_threshold:
+            return None
+
+        entry = self._entries[best_index]
+        if entry["expiry"] < time.monotonic():
+            self._remove(best_index)
+            return None
+
+        entry["last_access"] = time.monotonic()
+        self._hit_count += 1
+
+        logger.debug(f"Semantic cache hit", extra={
+            "similarity": best_score,
+            "cache_size": len(self._entries),
+        })
+
+        return entry["response"]
+
+    def set(self, query_embedding: List[float], response: ChatResponse) -> None:
+        """
+        Store a response under the given query embedding.
+
+        Near-duplicate queries (similarity above the merge threshold) replace
+        the existing entry instead of growing the cache.
+
+        Args:
+            query_embedding: Embedding of the query
+            response: Generated chat response to cache
+        """
+        query_vector = self._normalize(query_embedding)
+        now = time.monotonic()
+        entry = {
+            "response": response,
+            "expiry": now + self.ttl_seconds,
+            "last_access": now,
+        }
+
+        if self._embeddings is not None and len(self._entries) > 0:
+            similarities = self._embeddings @ query_vector
+            best_index = int(np.argmax(similarities))
+            if float(similarities[best_index]) >= self.merge_threshold:
+                # Near-duplicate query: refresh the existing entry in place
+                self._entries[best_index] = entry
+                self._embeddings[best_index] = query_vector
+                return
+
+        # Evict the least recently used entry if the cache is full
+        if len(self._entries) >= self.max_size:
+            lru_index = min(
+                range(len(self._entries)),
+                key=lambda i: self._entries[i]["last_access"],
+            )
+            self._remove(lru_index)
+
+        self._entries.append(entry)
+        if self._embeddings is None:
+            self._embeddings = query_vector.reshape(1, -1)
+        else:
+            self._embeddings = np.vstack([self._embeddings, query_vector])
+
+    def _remove(self, index: int) -> None:
+        """Remove the entry and embedding row at the given index."""
+        del self._entries[index]
+        if len(self._entries) == 0:
+            self._embeddings = None
+        else:
+            self._embeddings = np.delete(self._embeddings, index, axis=0)
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        self._embeddings = None
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "similarity_threshold": self.similarity_threshold,
+            "ttl_seconds": self.ttl_seconds,
+            "hit_rate": self._hit_count / max(self._total_requests, 1),
+        }
+
+
+# Global service instance
+semantic_cache = SemanticCache(
+    similarity_threshold=settings.semantic_cache_threshold,
+)
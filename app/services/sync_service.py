@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 
@@ -156,11 +157,20 @@ class SyncStateManager:
 
 class SyncService:
     """Background sync service for SolarWinds solutions."""
-    
+
+    # How long status readers may serve the published snapshot before
+    # re-reading Redis (bounds staleness from syncs on other workers)
+    SNAPSHOT_MAX_AGE_SECONDS = 5.0
+
     def __init__(self):
         self.scheduler: Optional[AsyncIOScheduler] = None
         self.state_manager = SyncStateManager()
         self.is_running = False
+        # Status snapshot published by writers and read lock-free; the
+        # whole dict is swapped atomically (a single assignment under the
+        # GIL) so readers always see a consistent state
+        self._status_snapshot: Dict[str, Any] = {}
+        self._snapshot_monotonic = 0.0
         
     async def start(self) -> None:
         """Start the sync service."""
@@ -205,6 +215,9 @@ class SyncService:
             
             # Run initial sync if it's been a while
             await self._check_initial_sync()
+
+            # Publish the first status snapshot for lock-free readers
+            await self._refresh_status_snapshot()
             
         except Exception as e:
             logger.error(f"Failed to start sync service: {str(e)}")
@@ -222,6 +235,7 @@ class SyncService:
             
             await self.state_manager.disconnect()
             self.is_running = False
+            await self._refresh_status_snapshot()
             
             logger.info("Sync service stopped")
             
@@ -378,8 +392,10 @@ class SyncService:
             }
             
         finally:
-            # Always release the lock
+            # Always release the lock, then publish the new state so
+            # status readers see the finished sync immediately
             await self.state_manager.release_sync_lock()
+            await self._refresh_status_snapshot()
     
     async def _cleanup_old_data(self) -> None:
         """Clean up old data and logs."""
@@ -452,12 +468,27 @@ class SyncService:
             raise
     
     async def get_sync_status(self) -> Dict[str, Any]:
-        """Get current sync status."""
+        """
+        Get current sync status.
+
+        Reads serve the snapshot published by the last writer without
+        touching Redis or any lock; the snapshot is refreshed when it
+        goes stale or no writer has published one yet.
+        """
+        if (
+            self._status_snapshot
+            and time.monotonic() - self._snapshot_monotonic < self.SNAPSHOT_MAX_AGE_SECONDS
+        ):
+            return dict(self._status_snapshot)
+        return await self._refresh_status_snapshot()
+
+    async def _refresh_status_snapshot(self) -> Dict[str, Any]:
+        """Rebuild the status snapshot from Redis and publish it."""
         try:
             last_sync_time = await self.state_manager.get_last_sync_time()
             is_in_progress = await self.state_manager.is_sync_in_progress()
             stats = await self.state_manager.get_sync_stats()
-            
+
             # Calculate next sync time
             next_sync_time = None
             if self.scheduler and self.scheduler.running:
@@ -465,8 +496,8 @@ class SyncService:
                 sync_job = next((job for job in jobs if job.id == "solarwinds_sync"), None)
                 if sync_job:
                     next_sync_time = sync_job.next_run_time
-            
-            return {
+
+            snapshot = {
                 "service_running": self.is_running,
                 "sync_in_progress": is_in_progress,
                 "last_sync_time": last_sync_time.isoformat() if last_sync_time else None,
@@ -474,14 +505,20 @@ class SyncService:
                 "sync_interval_minutes": settings.sync_interval_minutes,
                 "statistics": stats,
             }
-            
+
         except Exception as e:
             logger.error(f"Error getting sync status: {str(e)}")
-            return {
+            snapshot = {
                 "service_running": self.is_running,
                 "error": str(e),
             }
 
+        # Atomic swap: readers see either the old or the new dict, never
+        # a partially updated one
+        self._status_snapshot = snapshot
+        self._snapshot_monotonic = time.monotonic()
+        return dict(snapshot)
+
 
 # Global service instance
 sync_service = SyncService()
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 import re
 import asyncio
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from concurrent.futures import ThreadPoolExecutor
 
 from unstructured.partition.auto import partition
@@ -10,6 +10,7 @@ from unstructured.cleaners.core import clean_extra_whitespace, clean_non_ascii_c
 from unstructured.staging.base import convert_to_dict
 
 from app.core.logging import get_logger
+from app.models.schemas import SolutionRecord
 
 logger = get_logger(__name__)
 
@@ -320,6 +321,55 @@ class TextProcessingService:
         logger.info(f"Processed {len(processed_solutions)} solutions")
         return processed_solutions
     
+    async def batch_process_solutions_records(
+        self,
+        solutions: List[SolutionRecord],
+        batch_size: int = 10
+    ) -> List[Tuple[SolutionRecord, Dict[str, Any]]]:
+        """
+        Process solution records without the dict round-trip.
+
+        Unlike batch_process_solutions this takes pydantic records
+        directly and computes only what indexing needs (processed content
+        and its validation), skipping keywords/summaries and the
+        model_dump/reconstruct cycle per record.
+
+        Args:
+            solutions: Solution records to process
+            batch_size: Number of solutions to process concurrently
+
+        Returns:
+            (solution, result) pairs where result holds
+            processed_content and content_validation
+        """
+        pairs: List[Tuple[SolutionRecord, Dict[str, Any]]] = []
+
+        for i in range(0, len(solutions), batch_size):
+            batch = solutions[i:i + batch_size]
+
+            tasks = [self._process_record(solution) for solution in batch]
+            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            for solution, result in zip(batch, batch_results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Error processing solution in batch: {str(result)}")
+                else:
+                    pairs.append((solution, result))
+
+        logger.info(f"Processed {len(pairs)} solutions")
+        return pairs
+
+    async def _process_record(self, solution: SolutionRecord) -> Dict[str, Any]:
+        """Process one record into its indexed content and validation."""
+        processed_content = await self.process_solution_content(
+            solution.content, solution.title
+        )
+        validation = await self.validate_content(processed_content)
+        return {
+            "processed_content": processed_content,
+            "content_validation": validation,
+        }
+
     async def _process_single_solution(self, solution: Dict[str, Any]) -> Dict[str, Any]:
         """Process a single solution."""
         content = solution.get("content", "")
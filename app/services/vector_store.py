@@ -7,6 +7,7 @@ from typing import Dict, List, Optional, Any, Tuple
 from concurrent.futures import ThreadPoolExecutor
 
 import chromadb
+import numpy as np
 from chromadb.api.models.Collection import Collection
 from chromadb.config import Settings as ChromaSettings
 
@@ -18,6 +19,24 @@ from app.models.schemas import SolutionRecord, SourceDoc
 logger = get_logger(__name__)
 
 
+def _solution_metadata(solution: SolutionRecord) -> Dict[str, Any]:
+    """Flatten a SolutionRecord into the collection's metadata shape.
+
+    The schema is fixed, so one shared flattener replaces the dict
+    literal previously duplicated across the add/update paths and gives
+    the batch loop a single pre-resolved callable.
+    """
+    tags = solution.tags
+    return {
+        "title": solution.title,
+        "category": solution.category,
+        "updated_at": solution.updated_at.isoformat(),
+        "tags": ",".join(tags) if tags else "",
+        "url": solution.url or "",
+        "content_length": len(solution.content),
+    }
+
+
 class VectorStoreService:
     """Service for managing the Chroma vector database."""
     
@@ -25,6 +44,19 @@ class VectorStoreService:
         self.client: Optional[chromadb.ClientAPI] = None
         self.collection: Optional[Collection] = None
         self.executor = ThreadPoolExecutor(max_workers=4)
+        # Dense scoring cache for batch search: document ids/metadatas plus
+        # an L2-normalized float32 matrix so N queries score against all
+        # documents with one BLAS matmul instead of N index probes.
+        # Rebuilt lazily after any write marks it dirty.
+        self._matrix_ids: List[str] = []
+        self._matrix_metadatas: List[Dict[str, Any]] = []
+        self._matrix: Optional[np.ndarray] = None
+        # int8 variant of the matrix (per-row symmetric quantization) used
+        # when settings.embedding_quantization == "int8": 4x less memory
+        # bandwidth on the scan, which is what bounds large batches
+        self._matrix_i8: Optional[np.ndarray] = None
+        self._matrix_scales: Optional[np.ndarray] = None
+        self._matrix_dirty = True
         
     async def connect(self) -> None:
         """Connect to Chroma database."""
@@ -162,15 +194,7 @@ class VectorStoreService:
         if not self.collection:
             raise VectorStoreError("Collection not available")
         
-        # Prepare metadata
-        metadata = {
-            "title": solution.title,
-            "category": solution.category,
-            "updated_at": solution.updated_at.isoformat(),
-            "tags": ",".join(solution.tags) if solution.tags else "",
-            "url": solution.url or "",
-            "content_length": len(solution.content),
-        }
+        metadata = _solution_metadata(solution)
         
         # Add to collection
         self.collection.add(
@@ -179,18 +203,19 @@ class VectorStoreService:
             metadatas=[metadata],
             ids=[solution.id]
         )
+        self._matrix_dirty = True
     
     async def add_solutions_batch(
-        self, 
-        solutions: List[SolutionRecord], 
-        embeddings: List[List[float]]
+        self,
+        solutions: List[SolutionRecord],
+        embeddings: np.ndarray
     ) -> None:
         """
         Add multiple solutions to the vector store in batch.
-        
+
         Args:
             solutions: List of solution records
-            embeddings: List of corresponding embeddings
+            embeddings: Float32 matrix of shape (len(solutions), dim)
         """
         if not self.collection:
             raise VectorStoreError("Vector store not connected")
@@ -215,9 +240,9 @@ class VectorStoreService:
             raise VectorStoreError(f"Failed to add solutions batch: {str(e)}")
     
     def _add_solutions_batch_sync(
-        self, 
-        solutions: List[SolutionRecord], 
-        embeddings: List[List[float]]
+        self,
+        solutions: List[SolutionRecord],
+        embeddings: np.ndarray
     ) -> None:
         """Add solutions batch synchronously."""
         if not self.collection:
@@ -226,18 +251,7 @@ class VectorStoreService:
         # Prepare batch data
         ids = [solution.id for solution in solutions]
         documents = [solution.content for solution in solutions]
-        metadatas = []
-        
-        for solution in solutions:
-            metadata = {
-                "title": solution.title,
-                "category": solution.category,
-                "updated_at": solution.updated_at.isoformat(),
-                "tags": ",".join(solution.tags) if solution.tags else "",
-                "url": solution.url or "",
-                "content_length": len(solution.content),
-            }
-            metadatas.append(metadata)
+        metadatas = [_solution_metadata(solution) for solution in solutions]
         
         # Add batch to collection
         self.collection.add(
@@ -246,6 +260,7 @@ class VectorStoreService:
             metadatas=metadatas,
             ids=ids
         )
+        self._matrix_dirty = True
     
     async def search_similar(
         self, 
@@ -283,11 +298,13 @@ class VectorStoreService:
             # Convert results to SourceDoc objects
             source_docs = []
             for i, (doc_id, metadata, distance) in enumerate(results):
-                # Convert distance to similarity score (Chroma uses L2 distance)
-                similarity_score = max(0.0, 1.0 - distance)
+                # Convert distance to similarity score (Chroma uses L2 distance).
+                # float() unwraps numpy scalars so downstream serialization
+                # never round-trips through numpy types per source.
+                similarity_score = max(0.0, 1.0 - float(distance))
                 
                 if similarity_score >= min_score:
-                    source_doc = SourceDoc(
+                    source_doc = SourceDoc.construct_trusted(
                         id=doc_id,
                         title=metadata.get("title", "Unknown"),
                         score=similarity_score,
@@ -308,9 +325,244 @@ class VectorStoreService:
             logger.error(f"Error searching vector store: {str(e)}")
             raise VectorStoreError(f"Vector search failed: {str(e)}")
     
+    async def search_similar_batch(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int = 4,
+        category_filter: Optional[str] = None,
+        min_score: float = 0.0
+    ) -> List[List[SourceDoc]]:
+        """
+        Search for similar solutions for multiple queries in one RPC.
+
+        Chroma accepts a matrix of query embeddings, so N queries cost a
+        single collection.query call instead of N round trips.
+
+        Args:
+            query_embeddings: One embedding per query
+            top_k: Number of results to return per query
+            category_filter: Optional category filter
+            min_score: Minimum similarity score threshold
+
+        Returns:
+            One result list per query, aligned to the input order
+        """
+        if not self.collection:
+            raise VectorStoreError("Vector store not connected")
+
+        if not query_embeddings:
+            return []
+
+        try:
+            loop = asyncio.get_event_loop()
+
+            # Score against the cached document matrix with one matmul;
+            # fall back to a Chroma batch query if the cache can't be built
+            batch_results = await loop.run_in_executor(
+                self.executor,
+                self._search_matrix_batch_sync,
+                query_embeddings,
+                top_k,
+                category_filter
+            )
+            if batch_results is None:
+                distance_results = await loop.run_in_executor(
+                    self.executor,
+                    self._search_similar_batch_sync,
+                    query_embeddings,
+                    top_k,
+                    category_filter
+                )
+                batch_results = [
+                    [(doc_id, metadata, max(0.0, 1.0 - float(distance)))
+                     for doc_id, metadata, distance in results]
+                    for results in distance_results
+                ]
+
+            source_doc_lists = []
+            for results in batch_results:
+                source_docs = []
+                for doc_id, metadata, similarity_score in results:
+                    if similarity_score >= min_score:
+                        source_docs.append(SourceDoc.construct_trusted(
+                            id=doc_id,
+                            title=metadata.get("title", "Unknown"),
+                            score=similarity_score,
+                            category=metadata.get("category"),
+                            url=metadata.get("url"),
+                        ))
+                source_doc_lists.append(source_docs)
+
+            logger.info(f"Batch vector search completed for {len(query_embeddings)} queries", extra={
+                "top_k": top_k,
+                "category_filter": category_filter,
+                "min_score": min_score,
+            })
+
+            return source_doc_lists
+
+        except Exception as e:
+            logger.error(f"Error in batch vector search: {str(e)}")
+            raise VectorStoreError(f"Batch vector search failed: {str(e)}")
+
+    def _ensure_matrix_sync(self) -> bool:
+        """
+        Build the dense scoring cache from the collection if it is stale.
+
+        Returns:
+            True if the cache is usable, False otherwise
+        """
+        if not self._matrix_dirty and (self._matrix is not None or self._matrix_i8 is not None):
+            return True
+
+        if not self.collection:
+            return False
+
+        try:
+            results = self.collection.get(include=["embeddings", "metadatas"])
+            ids = results.get("ids") or []
+            embeddings = results.get("embeddings")
+            if not ids or embeddings is None or len(embeddings) == 0:
+                return False
+
+            matrix = np.ascontiguousarray(np.asarray(embeddings, dtype=np.float32))
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0.0] = 1.0
+            matrix /= norms
+
+            self._matrix_ids = list(ids)
+            self._matrix_metadatas = list(results.get("metadatas") or [{}] * len(ids))
+            if settings.embedding_quantization == "int8":
+                self._matrix_i8, self._matrix_scales = self._quantize(matrix)
+                self._matrix = None
+            else:
+                self._matrix = matrix
+                self._matrix_i8 = None
+                self._matrix_scales = None
+            self._matrix_dirty = False
+
+            logger.info(f"Built dense scoring cache with {len(ids)} documents")
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to build dense scoring cache: {str(e)}")
+            return False
+
+    @staticmethod
+    def _quantize(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Quantize rows to int8 with per-row symmetric scales.
+
+        Args:
+            matrix: float32 matrix to quantize
+
+        Returns:
+            Contiguous int8 matrix and per-row float32 scales such that
+            row ~= int8_row * scale / 127
+        """
+        scales = np.abs(matrix).max(axis=1).astype(np.float32)
+        scales[scales == 0.0] = 1.0
+        quantized = np.round(matrix / scales[:, None] * 127.0).astype(np.int8)
+        return np.ascontiguousarray(quantized), scales
+
+    def _search_matrix_batch_sync(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int,
+        category_filter: Optional[str] = None
+    ) -> Optional[List[List[Tuple[str, Dict[str, Any], float]]]]:
+        """
+        Score all queries against the cached matrix in one BLAS matmul.
+
+        Returns None when the cache is unavailable so the caller can fall
+        back to a Chroma batch query. Category-filtered searches also use
+        the fallback, where Chroma's where clause applies the filter before
+        top-k instead of after.
+        """
+        if category_filter:
+            return None
+
+        if not self._ensure_matrix_sync():
+            return None
+
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        queries /= norms
+
+        # (n_queries, n_docs) cosine similarities in a single GEMM
+        if self._matrix_i8 is not None:
+            # int8 scan: accumulate in int32, then rescale by the per-row
+            # quantization scales of both operands
+            queries_i8, query_scales = self._quantize(queries)
+            raw = queries_i8.astype(np.int32) @ self._matrix_i8.T.astype(np.int32)
+            scores = raw.astype(np.float32) * (
+                query_scales[:, None] * self._matrix_scales[None, :] / (127.0 * 127.0)
+            )
+        else:
+            scores = queries @ self._matrix.T
+
+        k = min(top_k, len(self._matrix_ids))
+        # Partial top-k per row, then sort only those k entries
+        top_indices = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+        batch_results = []
+        for row, indices in enumerate(top_indices):
+            ordered = indices[np.argsort(-scores[row, indices])]
+            # Report on the same scale as the Chroma L2 paths: for unit
+            # vectors distance = 2 - 2*cosine, so 1 - distance = 2c - 1.
+            # Keeps min_score and returned scores consistent whether or
+            # not the cache served the query
+            results = [
+                (
+                    self._matrix_ids[doc_index],
+                    self._matrix_metadatas[doc_index] or {},
+                    max(0.0, 2.0 * float(scores[row, doc_index]) - 1.0),
+                )
+                for doc_index in ordered
+            ]
+            batch_results.append(results)
+
+        return batch_results
+
+    def _search_similar_batch_sync(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int,
+        category_filter: Optional[str] = None
+    ) -> List[List[Tuple[str, Dict[str, Any], float]]]:
+        """Search similar documents for multiple queries synchronously."""
+        if not self.collection:
+            raise VectorStoreError("Collection not available")
+
+        where_clause = None
+        if category_filter:
+            where_clause = {"category": category_filter}
+
+        results = self.collection.query(
+            query_embeddings=query_embeddings,
+            n_results=top_k,
+            where=where_clause,
+            include=["documents", "metadatas", "distances"]
+        )
+
+        batch_results = []
+        for query_index in range(len(query_embeddings)):
+            result_list = []
+            if results["ids"] and query_index < len(results["ids"]):
+                for i in range(len(results["ids"][query_index])):
+                    result_list.append((
+                        results["ids"][query_index][i],
+                        results["metadatas"][query_index][i],
+                        results["distances"][query_index][i],
+                    ))
+            batch_results.append(result_list)
+
+        return batch_results
+
     def _search_similar_sync(
-        self, 
-        query_embedding: List[float], 
+        self,
+        query_embedding: List[float],
         top_k: int,
         category_filter: Optional[str] = None
     ) -> List[Tuple[str, Dict[str, Any], float]]:
@@ -342,6 +594,102 @@ class VectorStoreService:
         
         return result_list
     
+    async def list_solutions(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        category_filter: Optional[str] = None
+    ) -> List[SolutionRecord]:
+        """
+        List solutions with pagination.
+
+        Uses collection.get, which reads metadata directly without a
+        vector scan.
+
+        Args:
+            limit: Maximum number of solutions to return
+            offset: Number of solutions to skip
+            category_filter: Optional category filter
+
+        Returns:
+            List of solution records
+        """
+        if not self.collection:
+            raise VectorStoreError("Vector store not connected")
+
+        try:
+            loop = asyncio.get_event_loop()
+
+            return await loop.run_in_executor(
+                self.executor,
+                self._list_solutions_sync,
+                limit,
+                offset,
+                category_filter
+            )
+
+        except Exception as e:
+            logger.error(f"Error listing solutions: {str(e)}")
+            raise VectorStoreError(f"Failed to list solutions: {str(e)}")
+
+    def _list_solutions_sync(
+        self,
+        limit: int,
+        offset: int,
+        category_filter: Optional[str] = None
+    ) -> List[SolutionRecord]:
+        """List solutions synchronously."""
+        if not self.collection:
+            raise VectorStoreError("Collection not available")
+
+        where_clause = None
+        if category_filter:
+            where_clause = {"category": category_filter}
+
+        results = self.collection.get(
+            limit=limit,
+            offset=offset,
+            where=where_clause,
+            include=["documents", "metadatas"]
+        )
+
+        solutions = []
+        for i, doc_id in enumerate(results["ids"] or []):
+            solutions.append(self._record_from_result(
+                doc_id,
+                results["metadatas"][i],
+                results["documents"][i],
+            ))
+        return solutions
+
+    @staticmethod
+    def _record_from_result(
+        doc_id: str,
+        metadata: Dict[str, Any],
+        document: str
+    ) -> SolutionRecord:
+        """Build a SolutionRecord from a Chroma get result row."""
+        tags = []
+        if metadata.get("tags"):
+            tags = [tag.strip() for tag in metadata["tags"].split(",") if tag.strip()]
+
+        updated_at = datetime.utcnow()
+        if metadata.get("updated_at"):
+            try:
+                updated_at = datetime.fromisoformat(metadata["updated_at"])
+            except ValueError:
+                pass
+
+        return SolutionRecord(
+            id=doc_id,
+            title=metadata.get("title", "Unknown"),
+            category=metadata.get("category", "General"),
+            content=document,
+            updated_at=updated_at,
+            tags=tags,
+            url=metadata.get("url"),
+        )
+
     async def get_solution_by_id(self, solution_id: str) -> Optional[SolutionRecord]:
         """
         Get a solution by its ID.
@@ -382,32 +730,12 @@ class VectorStoreService:
             )
             
             if results["ids"] and results["ids"][0] == solution_id:
-                metadata = results["metadatas"][0]
-                document = results["documents"][0]
-                
-                # Parse tags
-                tags = []
-                if metadata.get("tags"):
-                    tags = [tag.strip() for tag in metadata["tags"].split(",") if tag.strip()]
-                
-                # Parse updated_at
-                updated_at = datetime.utcnow()
-                if metadata.get("updated_at"):
-                    try:
-                        updated_at = datetime.fromisoformat(metadata["updated_at"])
-                    except ValueError:
-                        pass
-                
-                return SolutionRecord(
-                    id=solution_id,
-                    title=metadata.get("title", "Unknown"),
-                    category=metadata.get("category", "General"),
-                    content=document,
-                    updated_at=updated_at,
-                    tags=tags,
-                    url=metadata.get("url"),
+                return self._record_from_result(
+                    solution_id,
+                    results["metadatas"][0],
+                    results["documents"][0],
                 )
-            
+
             return None
             
         except Exception as e:
@@ -454,15 +782,7 @@ class VectorStoreService:
         if not self.collection:
             raise VectorStoreError("Collection not available")
         
-        # Prepare metadata
-        metadata = {
-            "title": solution.title,
-            "category": solution.category,
-            "updated_at": solution.updated_at.isoformat(),
-            "tags": ",".join(solution.tags) if solution.tags else "",
-            "url": solution.url or "",
-            "content_length": len(solution.content),
-        }
+        metadata = _solution_metadata(solution)
         
         # Update in collection
         self.collection.update(
@@ -471,7 +791,90 @@ class VectorStoreService:
             documents=[solution.content],
             metadatas=[metadata]
         )
+        self._matrix_dirty = True
     
+    async def bulk_insert(
+        self,
+        solutions: List[SolutionRecord],
+        embeddings: np.ndarray
+    ) -> None:
+        """
+        Cold-load a whole record set in one collection call.
+
+        Chroma has no separate WAL-bypassing bulk RPC, so its bulk path
+        is simply a single add with the full id/document/metadata/
+        embedding arrays — one executor hop and one client round trip
+        for the entire load instead of one per batch.
+
+        Args:
+            solutions: All solution records to load
+            embeddings: Float32 matrix of shape (len(solutions), dim)
+        """
+        if not self.collection:
+            raise VectorStoreError("Vector store not connected")
+
+        if len(solutions) != len(embeddings):
+            raise VectorStoreError("Solutions and embeddings count mismatch")
+
+        try:
+            loop = asyncio.get_event_loop()
+
+            await loop.run_in_executor(
+                self.executor,
+                self._add_solutions_batch_sync,
+                solutions,
+                embeddings
+            )
+
+            logger.info(f"Bulk-inserted {len(solutions)} solutions into vector store")
+
+        except Exception as e:
+            logger.error(f"Error bulk-inserting solutions into vector store: {str(e)}")
+            raise VectorStoreError(f"Failed to bulk-insert solutions: {str(e)}")
+
+    async def update_solution_metadata(self, solution: SolutionRecord) -> None:
+        """
+        Update a solution's metadata without touching its embedding.
+
+        For metadata-only edits (tags, url, category) the document and
+        vector are already correct, so this skips re-sending them.
+
+        Args:
+            solution: Solution record carrying the new metadata
+        """
+        if not self.collection:
+            raise VectorStoreError("Vector store not connected")
+
+        try:
+            loop = asyncio.get_event_loop()
+
+            await loop.run_in_executor(
+                self.executor,
+                self._update_solution_metadata_sync,
+                solution
+            )
+
+            logger.debug(f"Updated solution metadata in vector store: {solution.title}")
+
+        except Exception as e:
+            logger.error(f"Error updating solution metadata in vector store: {str(e)}")
+            raise VectorStoreError(f"Failed to update solution metadata: {str(e)}")
+
+    def _update_solution_metadata_sync(self, solution: SolutionRecord) -> None:
+        """Update solution metadata synchronously."""
+        if not self.collection:
+            raise VectorStoreError("Collection not available")
+
+        metadata = _solution_metadata(solution)
+
+        self.collection.update(
+            ids=[solution.id],
+            metadatas=[metadata]
+        )
+        # Embeddings are untouched, but the scoring cache also carries
+        # metadata for filters, so it still needs a rebuild
+        self._matrix_dirty = True
+
     async def delete_solution(self, solution_id: str) -> None:
         """
         Delete a solution from the vector store.
@@ -503,6 +906,7 @@ class VectorStoreService:
             raise VectorStoreError("Collection not available")
         
         self.collection.delete(ids=[solution_id])
+        self._matrix_dirty = True
     
     async def get_collection_stats(self) -> Dict[str, Any]:
         """
@@ -1,4 +1,17 @@
+import sys
+
 import uvicorn
 
 if __name__ == "__main__":
-    uvicorn.run("run:app", host="127.0.0.1", port=8000, reload=True)
+    # uvloop + httptools (bundled with uvicorn[standard]) are 2-4x faster
+    # than the stdlib asyncio loop and h11 parser; uvloop is POSIX-only,
+    # so fall back to the default loop on Windows dev machines
+    on_windows = sys.platform == "win32"
+    uvicorn.run(
+        "app.main:app",
+        host="127.0.0.1",
+        port=8000,
+        reload=True,
+        loop="asyncio" if on_windows else "uvloop",
+        http="h11" if on_windows else "httptools",
+    )
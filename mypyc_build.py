@@ -0,0 +1,30 @@
+"""Optional mypyc build for hot Python-level modules.
+
+Compiles the embedding module (cache key hashing, LRU bookkeeping, batch
+assembly) to a C extension. The generated .so shadows the .py file
+transparently, so nothing else changes; delete the .so to fall back to
+the interpreted module.
+
+app/models/schemas.py stays interpreted: pydantic's BaseModel metaclass
+is not supported by mypyc, and its validation core is already compiled
+Rust.
+
+Usage:
+    pip install 'mypy[mypyc]'
+    python mypyc_build.py
+"""
+
+import subprocess
+import sys
+
+MODULES = [
+    "app/services/embedding.py",
+]
+
+
+def main() -> int:
+    return subprocess.call([sys.executable, "-m", "mypyc", *MODULES])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
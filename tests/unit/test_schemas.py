@@ -5,10 +5,12 @@ from datetime import datetime
 from pydantic import ValidationError
 
 from app.models.schemas import (
-    ChatRequest, 
-    ChatResponse, 
-    SourceDoc, 
-    SolutionRecord
+    BatchSearchRequest,
+    ChatRequest,
+    ChatResponse,
+    SourceDoc,
+    SolutionRecord,
+    StreamChatRequest
 )
 
 
@@ -93,6 +95,31 @@ def test_source_doc_optional_fields():
     assert doc.url is None
 
 
+@pytest.mark.unit
+def test_stream_chat_request_inverted_batch_bounds():
+    """Test StreamChatRequest with min_batch_size > max_batch_size should fail validation."""
+    with pytest.raises(ValidationError):
+        StreamChatRequest(query="printer jam", min_batch_size=32, max_batch_size=1)
+
+
+@pytest.mark.unit
+def test_batch_search_request_defaults():
+    """Test BatchSearchRequest with default parameters."""
+    request = BatchSearchRequest(queries=["printer jam", "vpn drops"])
+
+    assert request.queries == ["printer jam", "vpn drops"]
+    assert request.limit == 10
+    assert request.category is None
+    assert request.min_score == 0.0
+
+
+@pytest.mark.unit
+def test_batch_search_request_empty_queries():
+    """Test BatchSearchRequest with no queries should fail validation."""
+    with pytest.raises(ValidationError):
+        BatchSearchRequest(queries=[])
+
+
 @pytest.mark.unit
 def test_solution_record_valid():
     """Test SolutionRecord with valid data."""